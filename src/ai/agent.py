@@ -1,16 +1,75 @@
 # /ai/agent.py
 import pymunk
+import pymunk.batch
 import numpy as np
 import torch
 import torch.nn as nn
-import torch.optim as optim
+from torch.nn.utils import parameters_to_vector, vector_to_parameters
 from config.settings import Settings
+import math
 import os
 
 # Define collision categories
 GROUND_CATEGORY = 0b1
 AGENT_CATEGORY = 0b10
 
+# Body fields fetched per tick; the batch layout is (x, y, angle, vx, vy, w)
+BODY_STATE_FIELDS = (
+    pymunk.batch.BodyFields.BODY_ID
+    | pymunk.batch.BodyFields.POSITION
+    | pymunk.batch.BodyFields.ANGLE
+    | pymunk.batch.BodyFields.VELOCITY
+    | pymunk.batch.BodyFields.ANGULAR_VELOCITY
+)
+# Reorder to the network's feature layout (x, y, vx, vy, angle, w)
+STATE_COLUMNS = [0, 1, 3, 4, 2, 5]
+# State normalisation constants (screen size is applied per settings)
+TWO_PI = 2 * math.pi
+INV_TWO_PI = 1.0 / TWO_PI
+INV_500 = 1.0 / 500
+INV_10 = 0.1
+
+def state_norm(settings):
+    # Per-feature scale for the (x, y, vx, vy, angle, w) state layout
+    return np.array([
+        1.0 / settings.screen_width,
+        1.0 / settings.screen_height,
+        INV_500,
+        INV_500,
+        INV_TWO_PI,
+        INV_10
+    ], dtype=np.float32)
+
+# Same layout without the id, for writing body data back into a space
+BODY_WRITE_FIELDS = BODY_STATE_FIELDS & ~pymunk.batch.BodyFields.BODY_ID
+
+# Body parts as (name, mass, size, parent index, offset from the parent's
+# position); the torso is placed relative to the spawn point
+BODY_PARTS = [
+    ('torso', 5, (40, 60), None, (0, 0)),
+    ('l_upper_leg', 2, (15, 40), 0, (-15, 50)),
+    ('l_lower_leg', 1, (10, 30), 1, (0, 35)),
+    ('r_upper_leg', 2, (15, 40), 0, (15, 50)),
+    ('r_lower_leg', 1, (10, 30), 3, (0, 35)),
+]
+# Moments only depend on the part table, so compute them once at import
+BODY_MOMENTS = [pymunk.moment_for_box(mass, size) for _, mass, size, _, _ in BODY_PARTS]
+# Motorised pin joints as (name, body a, body b, anchor on a, anchor on b)
+JOINTS = [
+    ('l_hip', 0, 1, (-15, 30), (0, -20)),
+    ('l_knee', 1, 2, (0, 20), (0, -15)),
+    ('r_hip', 0, 3, (15, 30), (0, -20)),
+    ('r_knee', 3, 4, (0, 20), (0, -15)),
+]
+
+# State-dict keys of NeuralNetwork, in the order of the flat parameter list;
+# checkpoints keep this layout so they load either way
+PARAM_KEYS = [
+    'model.0.weight', 'model.0.bias',
+    'model.2.weight', 'model.2.bias',
+    'model.4.weight', 'model.4.bias'
+]
+
 class NeuralNetwork(nn.Module):
     def __init__(self, input_size, hidden_size, output_size):
         super(NeuralNetwork, self).__init__()
@@ -26,12 +85,201 @@ class NeuralNetwork(nn.Module):
     def forward(self, x):
         return self.model(x)
 
+    @classmethod
+    def from_params(cls, params):
+        # Module view of a flat parameter list, for tooling that wants nn.Linear
+        model = cls(params[0].shape[1], params[0].shape[0], params[4].shape[0])
+        model.load_state_dict(dict(zip(PARAM_KEYS, params)))
+        return model
+
     def mutate(self, mutation_rate):
+        # Same single-pass mutation as the flat agent buffers
         with torch.no_grad():
-            for param in self.parameters():
-                mutation_mask = torch.rand_like(param) < mutation_rate
-                random_values = torch.randn_like(param) * 0.5
-                param += mutation_mask * random_values
+            flat = parameters_to_vector(self.parameters())
+            mutate_flat(flat, mutation_rate)
+            vector_to_parameters(flat, self.parameters())
+
+def param_shapes(input_size, hidden_size, output_size):
+    # Shapes of [w1, b1, w2, b2, w3, b3], matching NeuralNetwork's layers
+    return [
+        (hidden_size, input_size), (hidden_size,),
+        (hidden_size, hidden_size), (hidden_size,),
+        (output_size, hidden_size), (output_size,)
+    ]
+
+def param_views(flat, shapes):
+    # Per-layer views into a flat parameter buffer; any leading dimensions
+    # (e.g. the agent dimension of a stacked population) are kept
+    views = []
+    offset = 0
+    for shape in shapes:
+        numel = int(np.prod(shape))
+        views.append(flat[..., offset:offset + numel].view(*flat.shape[:-1], *shape))
+        offset += numel
+    return views
+
+def init_params(shapes):
+    # One contiguous buffer for all parameters, initialised like nn.Linear
+    flat = torch.empty(sum(int(np.prod(shape)) for shape in shapes))
+    views = param_views(flat, shapes)
+    for weight, bias in zip(views[0::2], views[1::2]):
+        bound = 1.0 / np.sqrt(weight.shape[1])
+        weight.uniform_(-bound, bound)
+        bias.uniform_(-bound, bound)
+    return flat
+
+def mutate_flat(flat, mutation_rate):
+    # One rand/randn pair over the whole buffer instead of one per tensor
+    with torch.no_grad():
+        flat += torch.where(
+            torch.rand_like(flat) < mutation_rate,
+            torch.randn_like(flat) * 0.5,
+            0.0
+        )
+
+def population_forward(x, w1, b1, w2, b2, w3, b3):
+    # x: (N_agents, input_size) -> (N_agents, output_size)
+    h = torch.relu(torch.baddbmm(b1.unsqueeze(2), w1, x.unsqueeze(2)))
+    h = torch.relu(torch.baddbmm(b2.unsqueeze(2), w2, h))
+    return torch.tanh(torch.baddbmm(b3.unsqueeze(2), w3, h)).squeeze(2)
+
+_compiled_population_forward = None
+
+def compiled_population_forward():
+    # Compiled lazily and only once: weights are passed as arguments, so new
+    # generations reuse the kernel as long as the shapes stay the same
+    global _compiled_population_forward
+    if _compiled_population_forward is None:
+        _compiled_population_forward = torch.compile(population_forward, dynamic=False)
+    return _compiled_population_forward
+
+class PopulationPolicy(nn.Module):
+    # Runs the networks of a whole population in one batched forward pass.
+    # All parameters live in one (N_agents, num_params) block; every agent's
+    # flat buffer is re-pointed at its row, so loading or mutating a single
+    # agent writes straight into the shared block.
+    def __init__(self, agents, share_memory=False, dtype=torch.float32):
+        super(PopulationPolicy, self).__init__()
+        self.flat = nn.Parameter(
+            torch.stack([agent.flat_params.detach() for agent in agents]),
+            requires_grad=False
+        )
+        if share_memory:
+            # Let worker processes read the weights without copies
+            self.flat.share_memory_()
+        for i, agent in enumerate(agents):
+            agent.bind_params(self.flat.data[i])
+
+        # Same architecture as NeuralNetwork: two ReLU hidden layers, Tanh output
+        shapes = agents[0].param_shapes
+        self.w1, self.b1, self.w2, self.b2, self.w3, self.b3 = param_views(self.flat.data, shapes)
+
+        # Inference copy in a reduced precision (e.g. bfloat16); the float32
+        # block stays the master for mutation and loading. For float32 it is
+        # the block itself. Refreshed in place so scripted copies see it.
+        self.inference_flat = self.flat.data if dtype == torch.float32 else self.flat.data.to(dtype)
+        self.lw1, self.lb1, self.lw2, self.lb2, self.lw3, self.lb3 = param_views(self.inference_flat, shapes)
+
+    def forward(self, x):
+        # The casts are no-ops for float32 weights
+        return population_forward(
+            x.to(self.lw1.dtype), self.lw1, self.lb1, self.lw2, self.lb2, self.lw3, self.lb3
+        ).float()
+
+    def weights(self):
+        return (self.w1, self.b1, self.w2, self.b2, self.w3, self.b3)
+
+    def inference_weights(self):
+        return (self.lw1, self.lb1, self.lw2, self.lb2, self.lw3, self.lb3)
+
+    def refresh(self):
+        # Call after loading weights into agents so the inference copy follows
+        if self.inference_flat.data_ptr() != self.flat.data_ptr():
+            with torch.no_grad():
+                self.inference_flat.copy_(self.flat)
+
+    def broadcast(self, flat):
+        # Give every agent the same flat weights in one copy
+        with torch.no_grad():
+            self.flat.copy_(flat)
+        self.refresh()
+
+    def mutate(self, mutation_rate):
+        mutate_flat(self.flat, mutation_rate)
+        self.refresh()
+
+class PopulationState:
+    # Gathers the state of every agent body with one pymunk batch call per tick
+    # and scatters it into a preallocated (N_agents, input_size) tensor.
+    # Raw body data and motor targets are kept as contiguous arrays (SoA), with
+    # the pymunk objects only touched for the actual FFI reads and writes.
+    def __init__(self, space, agents, settings, bodies=None):
+        self.space = space
+        self.buffer = pymunk.batch.Buffer()
+        self.rows = {}
+        for agent in agents:
+            for body in agent.bodies:
+                self.rows[body.id] = len(self.rows)
+
+        self._ids = None
+        self._order = None
+        self._valid = None
+
+        # Raw body data in batch layout, one row per body, grouped by agent.
+        # May be an external (e.g. shared memory) array of the same shape.
+        if bodies is None:
+            bodies = np.zeros((len(self.rows), 6), dtype=np.float64)
+        self.bodies = bodies
+        self.positions = self.bodies[:, 0:2]
+        self.angles = self.bodies[:, 2]
+        self.velocities = self.bodies[:, 3:5]
+        self.angular_velocities = self.bodies[:, 5]
+
+        # Motor targets, one row per agent
+        self.motors = [motor for agent in agents for motor in agent.motors]
+        self.motor_rates = np.zeros((len(agents), len(agents[0].motors)), dtype=np.float32)
+
+        self._state = np.zeros((len(self.rows), 6), dtype=np.float32)
+        self.states = torch.from_numpy(self._state).view(len(agents), -1)
+        self._norm = state_norm(settings)
+
+    def _fetch(self):
+        self.buffer.clear()
+        pymunk.batch.get_space_bodies(self.space, BODY_STATE_FIELDS, self.buffer)
+        ids = np.frombuffer(self.buffer.int_buf(), dtype=np.uintp)
+        data = np.frombuffer(self.buffer.float_buf(), dtype=np.float64).reshape(-1, 6)
+
+        # Space iteration order only changes when bodies are added or removed
+        if self._ids is None or not np.array_equal(ids, self._ids):
+            self._ids = ids.copy()
+            order = np.array([self.rows.get(body_id, -1) for body_id in self._ids.tolist()], dtype=np.intp)
+            self._valid = order >= 0
+            self._order = order[self._valid]
+        return data
+
+    def sync_bodies(self):
+        # Refresh the SoA body data without building the network state
+        data = self._fetch()
+        self.bodies[self._order] = data[self._valid]
+
+    def gather(self):
+        self.sync_bodies()
+        state = self.bodies[:, STATE_COLUMNS]
+        np.mod(state[:, 4], TWO_PI, out=state[:, 4])
+        np.multiply(state, self._norm, out=self._state, casting='unsafe')
+        return self.states
+
+    def scatter(self):
+        # Inverse of gather: push the SoA body data into the space's bodies,
+        # used when the space only mirrors a simulation running elsewhere
+        data = self._fetch()
+        data[self._valid] = self.bodies[self._order]
+        pymunk.batch.set_space_bodies(self.space, BODY_WRITE_FIELDS, self.buffer)
+
+    def apply_actions(self, actions, max_motor_velocity):
+        np.multiply(actions.numpy(), max_motor_velocity, out=self.motor_rates)
+        for motor, rate in zip(self.motors, self.motor_rates.ravel().tolist()):
+            motor.rate = rate
 
 class Agent:
     def __init__(self, space, settings, agent_id):
@@ -41,21 +289,15 @@ class Agent:
         self.create_body()
 
         # State and action sizes
-        num_bodies = len(self.bodies)
-        self.input_size = num_bodies * 6  # 6 features per body part
+        self.input_size = len(self.bodies) * 6  # 6 features per body part
         self.output_size = len(self.motors)  # Number of motors
 
-        # Neural network and optimizer
-        self.model = NeuralNetwork(
-            input_size=self.input_size,
-            hidden_size=self.settings.get('hidden_size'),
-            output_size=self.output_size
-        )
-        self.optimizer = optim.Adam(
-            self.model.parameters(),
-            lr=self.settings.get('learning_rate')
+        # Network weights only; inference for the whole population runs
+        # batched through PopulationPolicy and PopulationState
+        self.param_shapes = param_shapes(
+            self.input_size, self.settings.get('hidden_size'), self.output_size
         )
-        self.criterion = nn.MSELoss()
+        self.bind_params(init_params(self.param_shapes))
         self.fitness = 0  # For tracking agent's performance
         self.start_x = self.bodies[0].position.x
 
@@ -67,181 +309,48 @@ class Agent:
 
         x_position = 100  # All agents start at the same x position
         y_position = 300
-
-        # Torso
-        mass = 5
-        size = (40, 60)
-        moment = pymunk.moment_for_box(mass, size)
-        torso_body = pymunk.Body(mass, moment)
-        torso_body.position = x_position, y_position
-        torso_shape = pymunk.Poly.create_box(torso_body, size)
-        torso_shape.friction = 1.0
-        torso_shape.elasticity = 0.0
-        torso_shape.filter = pymunk.ShapeFilter(
-            group=self.id + 1,
-            categories=AGENT_CATEGORY,
-            mask=GROUND_CATEGORY
-        )
-        # Assign agent reference to the shape
-        torso_shape.agent = self
-        self.space.add(torso_body, torso_shape)
-        self.bodies.append(torso_body)
-        self.shapes.append(torso_shape)
-
-        # Left Upper Leg
-        mass = 2
-        size = (15, 40)
-        moment = pymunk.moment_for_box(mass, size)
-        l_upper_leg_body = pymunk.Body(mass, moment)
-        l_upper_leg_body.position = torso_body.position.x - 15, torso_body.position.y + 50
-        l_upper_leg_shape = pymunk.Poly.create_box(l_upper_leg_body, size)
-        l_upper_leg_shape.friction = 1.0
-        l_upper_leg_shape.elasticity = 0.0
-        l_upper_leg_shape.filter = pymunk.ShapeFilter(
+        max_torque = self.settings.get('max_torque')
+        # Shared by every part of this agent
+        shape_filter = pymunk.ShapeFilter(
             group=self.id + 1,
             categories=AGENT_CATEGORY,
             mask=GROUND_CATEGORY
         )
-        l_upper_leg_shape.agent = self
-        self.space.add(l_upper_leg_body, l_upper_leg_shape)
-        self.bodies.append(l_upper_leg_body)
-        self.shapes.append(l_upper_leg_shape)
-
-        # Left Lower Leg
-        mass = 1
-        size = (10, 30)
-        moment = pymunk.moment_for_box(mass, size)
-        l_lower_leg_body = pymunk.Body(mass, moment)
-        l_lower_leg_body.position = l_upper_leg_body.position.x, l_upper_leg_body.position.y + 35
-        l_lower_leg_shape = pymunk.Poly.create_box(l_lower_leg_body, size)
-        l_lower_leg_shape.friction = 1.0
-        l_lower_leg_shape.elasticity = 0.0
-        l_lower_leg_shape.filter = pymunk.ShapeFilter(
-            group=self.id + 1,
-            categories=AGENT_CATEGORY,
-            mask=GROUND_CATEGORY
-        )
-        l_lower_leg_shape.agent = self
-        self.space.add(l_lower_leg_body, l_lower_leg_shape)
-        self.bodies.append(l_lower_leg_body)
-        self.shapes.append(l_lower_leg_shape)
-
-        # Right Upper Leg
-        mass = 2
-        size = (15, 40)
-        moment = pymunk.moment_for_box(mass, size)
-        r_upper_leg_body = pymunk.Body(mass, moment)
-        r_upper_leg_body.position = torso_body.position.x + 15, torso_body.position.y + 50
-        r_upper_leg_shape = pymunk.Poly.create_box(r_upper_leg_body, size)
-        r_upper_leg_shape.friction = 1.0
-        r_upper_leg_shape.elasticity = 0.0
-        r_upper_leg_shape.filter = pymunk.ShapeFilter(
-            group=self.id + 1,
-            categories=AGENT_CATEGORY,
-            mask=GROUND_CATEGORY
-        )
-        r_upper_leg_shape.agent = self
-        self.space.add(r_upper_leg_body, r_upper_leg_shape)
-        self.bodies.append(r_upper_leg_body)
-        self.shapes.append(r_upper_leg_shape)
-
-        # Right Lower Leg
-        mass = 1
-        size = (10, 30)
-        moment = pymunk.moment_for_box(mass, size)
-        r_lower_leg_body = pymunk.Body(mass, moment)
-        r_lower_leg_body.position = r_upper_leg_body.position.x, r_upper_leg_body.position.y + 35
-        r_lower_leg_shape = pymunk.Poly.create_box(r_lower_leg_body, size)
-        r_lower_leg_shape.friction = 1.0
-        r_lower_leg_shape.elasticity = 0.0
-        r_lower_leg_shape.filter = pymunk.ShapeFilter(
-            group=self.id + 1,
-            categories=AGENT_CATEGORY,
-            mask=GROUND_CATEGORY
-        )
-        r_lower_leg_shape.agent = self
-        self.space.add(r_lower_leg_body, r_lower_leg_shape)
-        self.bodies.append(r_lower_leg_body)
-        self.shapes.append(r_lower_leg_shape)
-
-        # Joints and Motors
-
-        # Torso to Left Upper Leg (Hip)
-        l_hip_joint = pymunk.PinJoint(torso_body, l_upper_leg_body, (-15, 30), (0, -20))
-        self.space.add(l_hip_joint)
-        self.joints.append(l_hip_joint)
-
-        l_hip_motor = pymunk.SimpleMotor(torso_body, l_upper_leg_body, 0)
-        l_hip_motor.max_force = self.settings.get('max_torque')
-        self.space.add(l_hip_motor)
-        self.motors.append(l_hip_motor)
-
-        # Left Upper Leg to Lower Leg (Knee)
-        l_knee_joint = pymunk.PinJoint(l_upper_leg_body, l_lower_leg_body, (0, 20), (0, -15))
-        self.space.add(l_knee_joint)
-        self.joints.append(l_knee_joint)
-
-        l_knee_motor = pymunk.SimpleMotor(l_upper_leg_body, l_lower_leg_body, 0)
-        l_knee_motor.max_force = self.settings.get('max_torque')
-        self.space.add(l_knee_motor)
-        self.motors.append(l_knee_motor)
-
-        # Torso to Right Upper Leg (Hip)
-        r_hip_joint = pymunk.PinJoint(torso_body, r_upper_leg_body, (15, 30), (0, -20))
-        self.space.add(r_hip_joint)
-        self.joints.append(r_hip_joint)
-
-        r_hip_motor = pymunk.SimpleMotor(torso_body, r_upper_leg_body, 0)
-        r_hip_motor.max_force = self.settings.get('max_torque')
-        self.space.add(r_hip_motor)
-        self.motors.append(r_hip_motor)
-
-        # Right Upper Leg to Lower Leg (Knee)
-        r_knee_joint = pymunk.PinJoint(r_upper_leg_body, r_lower_leg_body, (0, 20), (0, -15))
-        self.space.add(r_knee_joint)
-        self.joints.append(r_knee_joint)
-
-        r_knee_motor = pymunk.SimpleMotor(r_upper_leg_body, r_lower_leg_body, 0)
-        r_knee_motor.max_force = self.settings.get('max_torque')
-        self.space.add(r_knee_motor)
-        self.motors.append(r_knee_motor)
-
-    def update(self):
-        state = self.get_state()
-        action = self.choose_action(state)
-        self.apply_action(action)
-        self.calculate_fitness()
-
-    def get_state(self):
-        state = []
-        screen_width = self.settings.get('screen_width')
-        screen_height = self.settings.get('screen_height')
 
-        for body in self.bodies:
-            # Position
-            state.append(body.position.x / screen_width)
-            state.append(body.position.y / screen_height)
-            # Velocity
-            state.append(body.velocity.x / 500)
-            state.append(body.velocity.y / 500)
-            # Angle
-            state.append((body.angle % (2 * np.pi)) / (2 * np.pi))
-            # Angular Velocity
-            state.append(body.angular_velocity / 10)
-
-        return torch.tensor(state, dtype=torch.float32)
-
-    def choose_action(self, state):
-        self.model.eval()
-        with torch.no_grad():
-            action = self.model(state)
-        return action
-
-    def apply_action(self, action):
-        target_velocity = action.numpy() * self.settings.get('max_motor_velocity')
+        for (name, mass, size, parent, offset), moment in zip(BODY_PARTS, BODY_MOMENTS):
+            body = pymunk.Body(mass, moment)
+            if parent is None:
+                body.position = x_position + offset[0], y_position + offset[1]
+            else:
+                anchor = self.bodies[parent].position
+                body.position = anchor.x + offset[0], anchor.y + offset[1]
+            shape = pymunk.Poly.create_box(body, size)
+            shape.friction = 1.0
+            shape.elasticity = 0.0
+            shape.filter = shape_filter
+            # Assign agent reference to the shape
+            shape.agent = self
+            self.bodies.append(body)
+            self.shapes.append(shape)
 
-        for motor, target in zip(self.motors, target_velocity):
-            motor.rate = target
+        # Joints and Motors
+        constraints = []
+        for name, a, b, anchor_a, anchor_b in JOINTS:
+            joint = pymunk.PinJoint(self.bodies[a], self.bodies[b], anchor_a, anchor_b)
+            motor = pymunk.SimpleMotor(self.bodies[a], self.bodies[b], 0)
+            motor.max_force = max_torque
+            self.joints.append(joint)
+            self.motors.append(motor)
+            constraints += (joint, motor)
+
+        # One add for the whole agent instead of one per part
+        self.space.add(*self.bodies, *self.shapes, *constraints)
+
+    def bind_params(self, flat):
+        # Point the agent's parameters at a flat buffer (its own, or a row
+        # of a PopulationPolicy block)
+        self.flat_params = flat
+        self.params = param_views(flat, self.param_shapes)
 
     def calculate_fitness(self):
         current_x = self.bodies[0].position.x
@@ -254,9 +363,15 @@ class Agent:
     def get_position(self):
         return self.bodies[0].position
 
-    def save_model(self, filename):
+    def state_dict(self):
+        # Clone so the snapshot holds only this agent's weights, not the whole
+        # block, and survives the population being rebuilt
+        return {key: param.clone() for key, param in zip(PARAM_KEYS, self.params)}
+
+    def save_model(self, filename, state_dict=None):
+        # A snapshot taken earlier can be passed in to save from another thread
         try:
-            torch.save(self.model.state_dict(), filename)
+            torch.save(self.state_dict() if state_dict is None else state_dict, filename)
             print(f"Agent {self.id} model saved to {filename}")
         except Exception as e:
             print(f"Error saving model for Agent {self.id}: {e}")  # Optional: print error
@@ -264,7 +379,11 @@ class Agent:
     def load_model(self, filename):
         if os.path.exists(filename):
             try:
-                self.model.load_state_dict(torch.load(filename))
+                state_dict = torch.load(filename)
+                # Copy in place so views into a PopulationPolicy stay valid
+                with torch.no_grad():
+                    for param, key in zip(self.params, PARAM_KEYS):
+                        param.copy_(state_dict[key])
                 print(f"Agent {self.id} model loaded from {filename}")
             except Exception as e:
                 print(f"Error loading model for Agent {self.id}: {e}")  # Optional: print error
@@ -273,7 +392,7 @@ class Agent:
 
     def mutate(self):
         mutation_rate = self.settings.get('mutation_rate')
-        self.model.mutate(mutation_rate)
+        mutate_flat(self.flat_params, mutation_rate)
 
     def reset_position(self):
         # Reset agent's position to starting point
@@ -0,0 +1,181 @@
+# src/ai/parallel.py
+
+import numpy as np
+import pymunk
+import torch
+import torch.multiprocessing as mp
+from multiprocessing import shared_memory
+from ai.agent import Agent, PopulationState, population_forward
+from config.settings import Settings
+from game.world import create_ground
+
+PHYSICS_DT = 1 / 60.0
+
+
+class ParallelPopulation:
+    """
+    Simulates the population across several worker processes.
+
+    Each worker owns its own pymunk Space and a contiguous slice of the agents,
+    which sidesteps the GIL for the physics step. Workers publish their body
+    data into one shared-memory SoA block that the main process copies into
+    its (non-stepped) mirror space for rendering and fitness. Policy weights
+    are shared through torch shared memory, so loading and mutating them in
+    the main process is seen by the workers without any copies.
+    """
+
+    def __init__(self, num_workers):
+        """
+        Start the worker processes.
+
+        :param num_workers: Number of worker processes to spawn.
+        """
+        ctx = mp.get_context('spawn')
+        self.connections = []
+        self.processes = []
+        for _ in range(num_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+            process.start()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+        self.shm = None
+        self.bodies = None
+
+    def body_buffer(self, num_bodies):
+        """
+        Get the shared (num_bodies, 6) body array, reallocating it when the
+        population size changes.
+
+        :param num_bodies: Total number of bodies in the population.
+        :return: NumPy array backed by shared memory.
+        """
+        if self.bodies is None or self.bodies.shape[0] != num_bodies:
+            self._release_shm()
+            self.shm = shared_memory.SharedMemory(create=True, size=num_bodies * 6 * 8)
+            self.bodies = np.ndarray((num_bodies, 6), dtype=np.float64, buffer=self.shm.buf)
+            self.bodies[:] = 0
+        return self.bodies
+
+    def start_generation(self, settings, weights, ground_y, num_agents):
+        """
+        Hand a new generation to the workers and wait until they are ready.
+
+        :param settings: Instance of the Settings class.
+        :param weights: Shared-memory weight tensors of the PopulationPolicy.
+        :param ground_y: Height of the ground segment.
+        :param num_agents: Size of the population.
+        """
+        bounds = np.linspace(0, num_agents, len(self.connections) + 1).astype(int)
+        for conn, start, stop in zip(self.connections, bounds[:-1], bounds[1:]):
+            conn.send(('generation', (
+                dict(settings.settings), weights, ground_y,
+                self.shm.name, self.bodies.shape[0], int(start), int(stop)
+            )))
+        self._wait()
+
+    def step(self, num_steps=1):
+        """
+        Advance every sub-population by num_steps physics ticks.
+
+        :param num_steps: Number of physics ticks to run in each worker.
+        """
+        for conn in self.connections:
+            conn.send(('step', num_steps))
+        self._wait()
+
+    def close(self):
+        """Stop the worker processes and release the shared memory."""
+        for conn in self.connections:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        self._release_shm()
+
+    def _wait(self):
+        for conn in self.connections:
+            conn.recv()
+
+    def _release_shm(self):
+        if self.shm is not None:
+            self.bodies = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def _worker_main(conn):
+    """Worker loop: owns one Space and simulates its slice of the agents."""
+    torch.set_num_threads(1)
+    space = pymunk.Space()
+    settings = Settings()
+    agents = []
+    state = None
+    bodies = None
+    weights = None
+    shm = None
+    ground_y = None
+    tick = 0
+
+    while True:
+        command, payload = conn.recv()
+        if command == 'generation':
+            settings_dict, all_weights, new_ground_y, shm_name, num_bodies, start, stop = payload
+            settings.update(settings_dict)
+            space.gravity = (0.0, settings.get('gravity'))
+            if new_ground_y != ground_y:
+                ground_y = new_ground_y
+                for shape in list(space.static_body.shapes):
+                    space.remove(shape)
+                create_ground(space, ground_y)
+
+            for agent in agents:
+                agent.remove()
+            agents = [Agent(space, settings, agent_id=i) for i in range(start, stop)]
+
+            # Views into the old block must go before it can be closed
+            state = None
+            bodies = None
+            if shm is None or shm.name != shm_name:
+                if shm is not None:
+                    shm.close()
+                shm = shared_memory.SharedMemory(name=shm_name)
+            rows_per_agent = len(agents[0].bodies) if agents else 0
+            bodies = np.ndarray(
+                (num_bodies, 6), dtype=np.float64, buffer=shm.buf
+            )[start * rows_per_agent:stop * rows_per_agent]
+
+            weights = [w[start:stop] for w in all_weights]
+            state = PopulationState(space, agents, settings, bodies=bodies) if agents else None
+            if state is not None:
+                state.gather()
+            tick = 0
+            conn.send(True)
+        elif command == 'step':
+            if state is not None:
+                max_motor_velocity = settings.max_motor_velocity
+                action_every = max(1, settings.action_every)
+                for _ in range(payload):
+                    if tick % action_every == 0:
+                        states = state.gather()
+                        with torch.inference_mode():
+                            actions = population_forward(states, *weights)
+                        state.apply_actions(actions, max_motor_velocity)
+                    tick += 1
+                    space.step(PHYSICS_DT)
+                state.gather()
+            conn.send(True)
+        elif command == 'close':
+            break
+
+    state = None
+    bodies = None
+    if shm is not None:
+        shm.close()
+
+
+# Public Classes
+__all__ = ['ParallelPopulation']
@@ -2,48 +2,68 @@
 
 import os
 
+# Single source of truth for the defaults; Settings and default_settings()
+# both copy from here so the two can no longer drift apart
+DEFAULT_SETTINGS = {
+    'screen_width': 800,
+    'screen_height': 600,
+    'learning_rate': 0.001,
+    'hidden_size': 128,
+    'iteration_time': 60,  # Simulated seconds per generation
+    'batch_size': 32,
+    'mutation_rate': 0.05,
+    'gravity': 1000.0,  # Updated to match slider's initial value
+    'max_torque': 50000.0,  # Example mid-point value
+    'max_motor_velocity': 10.0,
+    'fast_forward_factor': 1,  # Simulated seconds per wall-clock second; >1 trains faster than real time
+    'action_every': 4,  # Physics ticks per policy evaluation; motor targets hold in between
+    'save_interval': 100,
+    'enable_transparency': False,
+    'compile_policy': False,  # Compile the policy with torch.compile (needs a C++ toolchain)
+    'num_workers': 1,  # Processes simulating sub-populations; 1 runs in-process
+    'overlap_physics': False,  # Step physics on a thread during inference (actions lag one tick)
+    'policy_dtype': 'float32',  # Population inference precision: 'float32', 'bfloat16' or 'float16'
+    'enable_recording': False,  # New setting for enabling recording
+    'video_output_folder': os.path.join('src', 'recordings'),  # New setting for video output
+    'running': False,
+    'generation': 1  # Start from generation 1
+}
+
+# Runtime state rather than user-tunable settings
+RUNTIME_KEYS = ('screen_width', 'screen_height', 'running', 'generation')
+# Keys mirrored as attributes; any other key is only kept in the dict
+ATTRIBUTE_KEYS = frozenset(DEFAULT_SETTINGS)
+
 class Settings:
+    # Fixed attribute set, one slot per setting, so hot-path reads are plain
+    # slot fetches rather than instance dict lookups
+    __slots__ = ('settings',) + tuple(DEFAULT_SETTINGS)
+
     def __init__(self):
         # Initialize default settings
-        self.settings = {
-            'screen_width': 800,
-            'screen_height': 600,
-            'learning_rate': 0.001,
-            'hidden_size': 128,
-            'iteration_time': 60,
-            'batch_size': 32,
-            'mutation_rate': 0.05,
-            'gravity': 1000.0,  # Updated to match slider's initial value
-            'max_torque': 50000.0,  # Example mid-point value
-            'max_motor_velocity': 10.0,
-            'save_interval': 100,
-            'enable_transparency': False,
-            'enable_recording': False,  # New setting for enabling recording
-            'video_output_folder': os.path.join('src', 'recordings'),  # New setting for video output
-            'running': False,
-            'generation': 1  # Start from generation 1
-        }
+        self.settings = dict(DEFAULT_SETTINGS)
+        # Mirror every key as an attribute for the per-tick hot paths
+        for key, value in self.settings.items():
+            setattr(self, key, value)
 
     def get(self, key):
+        # Kept for cold paths; per-frame code reads the attributes directly
         return self.settings.get(key)
 
     def set(self, key, value):
         self.settings[key] = value
+        # Keys from older or hand-edited settings have no slot; get() still sees them
+        if key in ATTRIBUTE_KEYS:
+            setattr(self, key, value)
+
+    def update(self, values):
+        # Set several keys at once, keeping the attributes in sync
+        for key, value in values.items():
+            self.set(key, value)
 
     def default_settings(self):
         # Return a copy of default settings
         return {
-            'learning_rate': 0.001,
-            'hidden_size': 128,
-            'iteration_time': 60,
-            'batch_size': 32,
-            'mutation_rate': 0.05,
-            'gravity': 1000.0,  # Ensure the new setting is included
-            'max_torque': 50000.0,  # Ensure the new setting is included
-            'max_motor_velocity': 10.0,
-            'save_interval': 100,
-            'enable_transparency': False,
-            'enable_recording': False,  # Ensure the new setting is included
-            'video_output_folder': os.path.join('src', 'recordings')  # Ensure default is included
-            # Add other default settings as needed
+            key: value for key, value in DEFAULT_SETTINGS.items()
+            if key not in RUNTIME_KEYS
         }
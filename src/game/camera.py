@@ -7,15 +7,28 @@ class Camera:
         # Initialize camera properties
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.offset = Vector2(0, 0)
+        # Offset kept as plain floats; Vector2 only at the API boundary
+        self.offset_x = 0.0
+        self.offset_y = 0.0
         self.speed = 10.0
         self.max_speed = 20.0
         self.min_speed = 5.0
+
+        # Boundaries of the scene (adjust these values based on your game world)
+        self.bounds_x = (-5000.0, 5000.0)
+        self.bounds_y = (-2000.0, 2000.0)
         
         # Movement state
         self.moving = False
-        self.drag_start = Vector2(0, 0)
-        self.initial_offset = Vector2(0, 0)
+        self.drag_start_x = 0.0
+        self.drag_start_y = 0.0
+        self.initial_offset_x = 0.0
+        self.initial_offset_y = 0.0
+
+    @property
+    def offset(self):
+        """Current camera offset as a Vector2"""
+        return Vector2(self.offset_x, self.offset_y)
 
     def resize(self, width, height):
         """Handle viewport resize"""
@@ -26,26 +39,24 @@ class Camera:
 
     def move(self, dx, dy):
         """Move camera by delta amounts"""
-        self.offset.x += dx
-        self.offset.y += dy
+        self.offset_x += dx
+        self.offset_y += dy
         self.clamp_offset()
 
     def set_position(self, x, y):
         """Set absolute camera position"""
-        self.offset.x = x
-        self.offset.y = y
+        self.offset_x = x
+        self.offset_y = y
         self.clamp_offset()
 
     def clamp_offset(self):
         """Prevent camera from moving too far from the scene"""
-        # Define boundaries (adjust these values based on your game world)
-        max_x = 5000  # Maximum x coordinate
-        min_x = -5000  # Minimum x coordinate
-        max_y = 2000  # Maximum y coordinate
-        min_y = -2000  # Minimum y coordinate
-
-        self.offset.x = max(min(self.offset.x, max_x), min_x)
-        self.offset.y = max(min(self.offset.y, max_y), min_y)
+        min_x, max_x = self.bounds_x
+        min_y, max_y = self.bounds_y
+        x = self.offset_x
+        y = self.offset_y
+        self.offset_x = max_x if x > max_x else (min_x if x < min_x else x)
+        self.offset_y = max_y if y > max_y else (min_y if y < min_y else y)
 
     def handle_event(self, event, menu_visible):
         """Handle camera-related input events"""
@@ -55,8 +66,9 @@ class Camera:
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 3:  # Right mouse button
                 self.moving = True
-                self.drag_start = Vector2(event.pos)
-                self.initial_offset = Vector2(self.offset)
+                self.drag_start_x, self.drag_start_y = event.pos
+                self.initial_offset_x = self.offset_x
+                self.initial_offset_y = self.offset_y
                 return True
             elif event.button == 4:  # Mouse wheel up
                 self.speed = min(self.speed + 1, self.max_speed)
@@ -71,9 +83,9 @@ class Camera:
                 return True
 
         elif event.type == pygame.MOUSEMOTION and self.moving:
-            current_pos = Vector2(event.pos)
-            delta = current_pos - self.drag_start
-            self.offset = self.initial_offset - delta
+            x, y = event.pos
+            self.offset_x = self.initial_offset_x - (x - self.drag_start_x)
+            self.offset_y = self.initial_offset_y - (y - self.drag_start_y)
             self.clamp_offset()
             return True
 
@@ -81,12 +93,12 @@ class Camera:
 
     def get_position(self):
         """Get current camera position"""
-        return Vector2(self.offset)
+        return Vector2(self.offset_x, self.offset_y)
 
     def screen_to_world(self, screen_pos):
         """Convert screen coordinates to world coordinates"""
-        return Vector2(screen_pos) + self.offset
+        return Vector2(screen_pos[0] + self.offset_x, screen_pos[1] + self.offset_y)
 
     def world_to_screen(self, world_pos):
         """Convert world coordinates to screen coordinates"""
-        return Vector2(world_pos) - self.offset
\ No newline at end of file
+        return Vector2(world_pos[0] - self.offset_x, world_pos[1] - self.offset_y)
\ No newline at end of file
@@ -0,0 +1,16 @@
+# src/game/display.py
+
+import pygame
+
+# Preferred window flags; SCALED lets SDL present the frame through a
+# GPU-backed renderer, DOUBLEBUF flips instead of copying
+DISPLAY_FLAGS = pygame.SCALED | pygame.DOUBLEBUF | pygame.RESIZABLE
+# Used when no hardware renderer is available (e.g. headless drivers)
+FALLBACK_FLAGS = pygame.DOUBLEBUF | pygame.RESIZABLE
+
+def set_display_mode(width, height):
+    """Open or resize the game window, preferring the hardware-backed mode"""
+    try:
+        return pygame.display.set_mode((width, height), DISPLAY_FLAGS)
+    except pygame.error:
+        return pygame.display.set_mode((width, height), FALLBACK_FLAGS)
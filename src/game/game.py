@@ -2,77 +2,58 @@
 
 import pygame
 import pymunk
-from pymunk.pygame_util import DrawOptions
-from ai.agent import Agent
+from ai.agent import Agent, PopulationPolicy, PopulationState, compiled_population_forward
+from ai.parallel import ParallelPopulation
 from gui.gui import GUI
 from config.settings import Settings
 from game.camera import Camera
+from game.display import set_display_mode
+from game.sprites import AgentSprites
+from game.world import create_ground
 import os
 import time
-
-# Define collision categories as class-level constants
-class CollisionCategory:
-    GROUND = 0b1
-    AGENT = 0b10
-
-class CustomDrawOptions(DrawOptions):
-    """Enhanced drawing options for PyMunk shapes"""
-    def __init__(self, surface, agents, best_agent, enable_transparency):
-        super().__init__(surface)
-        self.agents = agents
-        self.best_agent = best_agent
-        self.enable_transparency = enable_transparency
-        
-        # Cache colors for better performance
-        self.colors = {
-            'best_agent': (0, 0, 255),
-            'regular_agent': {
-                'transparent': (255, 0, 0, 100),
-                'opaque': (255, 0, 0)
-            },
-            'default': (0, 0, 0)
-        }
-
-    def draw_shape(self, shape):
-        """Enhanced shape drawing with color management"""
-        # Determine shape color
-        if hasattr(shape, 'agent'):
-            if shape.agent == self.best_agent:
-                color = self.colors['best_agent']
-            else:
-                color = (self.colors['regular_agent']['transparent'] 
-                        if self.enable_transparency 
-                        else self.colors['regular_agent']['opaque'])
-        else:
-            color = self.colors['default']
-
-        # Draw based on shape type
-        if isinstance(shape, pymunk.Segment):
-            self._draw_segment(shape, color)
-        elif isinstance(shape, pymunk.Poly):
-            self._draw_polygon(shape, color)
-        elif isinstance(shape, pymunk.Circle):
-            self._draw_circle(shape, color)
-
-    def _draw_segment(self, shape, color):
-        """Draw segment shapes"""
-        body = shape.body
-        pv1 = self.transform_point(body.position + shape.a.rotated(body.angle))
-        pv2 = self.transform_point(body.position + shape.b.rotated(body.angle))
-        pygame.draw.lines(self.surface, color[:3], False, [pv1, pv2], 
-                         int(shape.radius))
-
-    def _draw_polygon(self, shape, color):
-        """Draw polygon shapes"""
-        vertices = [self.transform_point(v.rotated(shape.body.angle) + 
-                   shape.body.position) for v in shape.get_vertices()]
-        pygame.draw.polygon(self.surface, color[:3], vertices)
-
-    def _draw_circle(self, shape, color):
-        """Draw circle shapes"""
-        pos = self.transform_point(shape.body.position)
-        pygame.draw.circle(self.surface, color[:3], 
-                         (int(pos.x), int(pos.y)), int(shape.radius))
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import torch
+
+# Number of rendered overlay strings kept around
+TEXT_CACHE_SIZE = 32
+
+# Event types read by the game loop, the camera, the GUI and the settings menu
+HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWFOCUSLOST,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION
+]
+
+# Fixed physics timestep, decoupled from the display rate
+PHYSICS_DT = 1 / 60.0
+# Display frame rate cap
+DISPLAY_FPS = 60
+# Upper bound on physics ticks per rendered frame (times the fast-forward
+# factor), so a slow machine drops simulated time instead of falling behind
+MAX_STEPS_PER_FRAME = 4
+# Wall-clock seconds per frame physics may use; the rest is left for
+# drawing and input, so big populations can't freeze the window
+PHYSICS_BUDGET = 0.75 / DISPLAY_FPS
+
+# Camera arrow keys as bits of Game.arrow_mask
+ARROW_BITS = {
+    pygame.K_LEFT: 1 << 0,
+    pygame.K_RIGHT: 1 << 1,
+    pygame.K_UP: 1 << 2,
+    pygame.K_DOWN: 1 << 3
+}
+
+# Agent colors; the best agent of the last generation stands out in blue
+BEST_AGENT_COLOR = (0, 0, 255)
+AGENT_COLOR = (255, 0, 0)
+TRANSPARENT_AGENT_COLOR = (255, 0, 0, 100)
 
 class Game:
     """Main game class with enhanced organization and features"""
@@ -87,6 +68,11 @@ class Game:
         """Initialize Pygame"""
         pygame.init()
         self.clock = pygame.time.Clock()
+        # Only queue the events the game actually handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        # Bit per held arrow key, maintained from KEYDOWN/KEYUP
+        self.arrow_mask = 0
 
     def init_settings(self):
         """Initialize game settings"""
@@ -102,14 +88,19 @@ class Game:
 
     def init_display(self):
         """Initialize display and UI components"""
-        self.screen = pygame.display.set_mode(
-            (self.screen_width, self.screen_height),
-            pygame.RESIZABLE
-        )
+        self.screen = set_display_mode(self.screen_width, self.screen_height)
         pygame.display.set_caption("AI Evolution Game")
         # Pass the screen to GUI for SettingsMenu integration
         self.gui = GUI(self.settings, self.screen)
         self.camera = Camera(self.screen_width, self.screen_height)
+        self.agent_sprites = AgentSprites()
+        # One color per agent, rebuilt when the best agent or transparency change
+        self.agent_colors = None
+        self._agent_colors_key = None
+        # Overlay text changes a few times a second at most, so rendered
+        # strings are cached by their text
+        self.info_font = pygame.font.SysFont(None, 24)
+        self._text_cache = {}
 
     def init_state(self):
         """Initialize game state"""
@@ -117,29 +108,29 @@ class Game:
         self.agents = []
         self.best_agent = None
         self.generation = self.settings.get('generation')
-        # Initialize timing variables
-        self.iteration_start_time = None
-        self.pause_start_time = None
-        self.accumulated_time = 0
         self.paused = False
+        # Optional worker processes that run the physics for sub-populations
+        num_workers = self.settings.get('num_workers')
+        self.parallel = ParallelPopulation(num_workers) if num_workers > 1 else None
+        self.population_state = None
+        # Optional thread that overlaps the physics step with inference
+        self.physics_pool = None
+        if self.settings.get('overlap_physics') and self.parallel is None:
+            self.physics_pool = ThreadPoolExecutor(max_workers=1)
+        # Hidden Tk root for the load dialog, created on first use
+        self._tk_root = None
+        # Thread that writes the best model of each generation to disk
+        self.io_pool = ThreadPoolExecutor(max_workers=1)
         self.create_agents()
 
     def create_ground(self):
         """Create the game environment with ground"""
-        static_body = self.space.static_body
-        ground_y = self.screen_height - 50
-        
-        ground = pymunk.Segment(
-            static_body,
-            (-1000, ground_y),
-            (10000, ground_y),
-            5.0
-        )
-        
-        ground.friction = 1.0
-        ground.elasticity = 0.0
-        ground.filter = pymunk.ShapeFilter(categories=CollisionCategory.GROUND)
-        self.space.add(ground)
+        self.ground_y = self.screen_height - 50
+        ground = create_ground(self.space, self.ground_y)
+        # The ground never moves, so its endpoints are kept in world space
+        # and drawn with just the camera offset
+        self.ground_points = ((ground.a.x, ground.a.y), (ground.b.x, ground.b.y))
+        self.ground_width = int(ground.radius)
 
     def create_agents(self):
         """Create and initialize agents"""
@@ -150,7 +141,58 @@ class Game:
             agent = Agent(self.space, self.settings, agent_id=i)
             self.agents.append(agent)
         
+        # One batched policy over all agents' networks. Workers read the
+        # shared float32 weights directly, so reduced precision is in-process only.
+        dtype = torch.float32
+        if self.parallel is None:
+            dtype = getattr(torch, self.settings.get('policy_dtype'), torch.float32)
+        self.policy = PopulationPolicy(
+            self.agents,
+            share_memory=self.parallel is not None,
+            dtype=dtype
+        )
+
+        bodies = None
+        if self.parallel is not None:
+            # Drop the old state first so its view of the shared block goes away
+            self.population_state = None
+            bodies = self.parallel.body_buffer(sum(len(agent.bodies) for agent in self.agents))
+        self.population_state = PopulationState(self.space, self.agents, self.settings, bodies=bodies)
+
+        if self.parallel is not None:
+            self.parallel.start_generation(
+                self.settings, self.policy.weights(), self.ground_y, len(self.agents)
+            )
+        else:
+            self.policy_forward = self.build_policy_forward()
         self.best_agent = None
+        # Physics ticks of this generation; it ends after iteration_time
+        # simulated seconds of them
+        self.tick = 0
+        # New population, so the cached agent colors are stale
+        self._agent_colors_key = None
+        # Agents' fitness as one contiguous array, written every tick and
+        # copied onto the agents only when a generation ends
+        self.fitness_buf = np.zeros(len(self.agents), dtype=np.float64)
+        self.start_x = np.array([agent.start_x for agent in self.agents], dtype=np.float64)
+        self.bodies_per_agent = len(self.agents[0].bodies)
+
+    def build_policy_forward(self):
+        """Pick the compiled or scripted inference path for the policy"""
+        if self.settings.get('compile_policy'):
+            try:
+                forward = compiled_population_forward()
+                weights = self.policy.inference_weights()
+                dtype = weights[0].dtype
+                with torch.inference_mode():
+                    forward(self.population_state.states.to(dtype), *weights)
+                return lambda states: forward(states.to(dtype), *weights).float()
+            except Exception as e:
+                print(f"Policy compilation failed, using TorchScript: {e}")
+
+        # The scripted module shares its parameters, so mutation and model
+        # loading stay visible to it
+        return torch.jit.script(self.policy).eval()
 
     def reset_agents(self):
         """Reset all agents"""
@@ -160,17 +202,48 @@ class Game:
 
     def run(self):
         """Main game loop with improved organization"""
+        settings = self.settings
+        accumulator = 0.0
         while self.running:
-            delta_time = self.clock.tick(60) / 1000.0  # Convert to seconds
-            
+            delta_time = self.clock.tick(DISPLAY_FPS) / 1000.0  # Convert to seconds
             self.handle_events()
             
-            if self.settings.get('running') and not self.paused:
-                self.update(delta_time)
+            if settings.running and not self.paused:
+                # Fast-forward simulates several seconds per wall-clock second
+                factor = max(1, int(settings.fast_forward_factor))
+                accumulator += delta_time * factor
+                due = int(accumulator / PHYSICS_DT)
+                steps = min(due, MAX_STEPS_PER_FRAME * factor)
+                deadline = time.perf_counter() + PHYSICS_BUDGET
+                done = 0
+                while done < steps:
+                    self.update(PHYSICS_DT)
+                    done += 1
+                    # Checked after each tick, so a frame with ticks due always runs one
+                    if time.perf_counter() > deadline:
+                        break
+                if done < due:
+                    # Fell behind; drop the backlog rather than carry it over
+                    accumulator = 0.0
+                else:
+                    accumulator -= done * PHYSICS_DT
+            else:
+                accumulator = 0.0
             
             self.draw()
             pygame.display.flip()
 
+        if self.physics_pool is not None:
+            self.physics_pool.shutdown()
+        # Let pending model saves finish
+        self.io_pool.shutdown()
+        if self._tk_root is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
+        if self.parallel is not None:
+            self.population_state = None
+            self.parallel.close()
+
     def handle_events(self):
         """Handle all game events"""
         for event in pygame.event.get():
@@ -179,19 +252,24 @@ class Game:
             elif event.type == pygame.VIDEORESIZE:
                 self.handle_resize(event.w, event.h)
             else:
+                if event.type == pygame.KEYDOWN:
+                    self.arrow_mask |= ARROW_BITS.get(event.key, 0)
+                elif event.type == pygame.KEYUP:
+                    self.arrow_mask &= ~ARROW_BITS.get(event.key, 0)
+                elif event.type == pygame.WINDOWFOCUSLOST:
+                    # Key releases are not delivered while unfocused
+                    self.arrow_mask = 0
                 self.handle_game_event(event)
 
-        self.handle_continuous_input()
+        if self.arrow_mask:
+            self.handle_continuous_input()
         self.handle_gui_state()
 
     def handle_resize(self, width, height):
         """Handle window resize events"""
         self.screen_width = width
         self.screen_height = height
-        self.screen = pygame.display.set_mode(
-            (width, height),
-            pygame.RESIZABLE
-        )
+        self.screen = set_display_mode(width, height)
         self.camera.resize(width, height)
         self.gui.resize(width, height)
         # Inform SettingsMenu of resize to stop recording if necessary
@@ -206,17 +284,17 @@ class Game:
 
     def handle_continuous_input(self):
         """Handle continuous keyboard input"""
-        keys = pygame.key.get_pressed()
+        keys = self.arrow_mask
         
         if not self.gui.settings_menu.visible:
             camera_speed = self.camera.speed
-            if keys[pygame.K_LEFT]:
+            if keys & ARROW_BITS[pygame.K_LEFT]:
                 self.camera.move(-camera_speed, 0)
-            if keys[pygame.K_RIGHT]:
+            if keys & ARROW_BITS[pygame.K_RIGHT]:
                 self.camera.move(camera_speed, 0)
-            if keys[pygame.K_UP]:
+            if keys & ARROW_BITS[pygame.K_UP]:
                 self.camera.move(0, -camera_speed)
-            if keys[pygame.K_DOWN]:
+            if keys & ARROW_BITS[pygame.K_DOWN]:
                 self.camera.move(0, camera_speed)
 
     def handle_gui_state(self):
@@ -228,56 +306,67 @@ class Game:
             self.gui.load_requested = False
             
         if self.gui.pause_requested is not None:
-            if self.gui.pause_requested != self.paused:  # Only handle state changes
-                if self.gui.pause_requested:  # Pausing
-                    if self.iteration_start_time is not None:
-                        self.pause_start_time = time.time()
-                        # Store current elapsed time
-                        self.accumulated_time += self.pause_start_time - self.iteration_start_time
-                else:  # Unpausing
-                    if self.pause_start_time is not None:
-                        self.iteration_start_time = time.time()
-                        self.pause_start_time = None
-                    elif self.iteration_start_time is None:
-                        # First start of simulation
-                        self.iteration_start_time = time.time()
-                        self.accumulated_time = 0
-            
+            # The generation timer counts simulated time, so pausing needs no bookkeeping
             self.paused = self.gui.pause_requested
             self.gui.pause_requested = None
                 
         if self.gui.stop_requested:
             self.settings.set('running', False)
-            self.iteration_start_time = None
-            self.pause_start_time = None
-            self.accumulated_time = 0
             self.reset_agents()
             self.gui.stop_requested = False
 
     def update(self, delta_time):
         """Update game state with corrected time tracking"""
-        # Initialize timer when simulation starts running
-        if self.iteration_start_time is None and self.settings.get('running'):
-            self.iteration_start_time = time.time()
-            self.accumulated_time = 0
-            self.pause_start_time = None
-        
-        if self.iteration_start_time is not None and not self.paused:
-            current_time = time.time()
-            total_elapsed_time = self.accumulated_time
-            if not self.paused:
-                total_elapsed_time += current_time - self.iteration_start_time
-                
-            iteration_time = self.settings.get('iteration_time')
+        settings = self.settings
+        if settings.running and not self.paused:
+            if self.parallel is not None:
+                # Workers step their sub-populations; mirror the result
+                self.parallel.step()
+                self.tick += 1
+                self.population_state.scatter()
+                self.update_fitness()
+            else:
+                # Update agents with a single batched forward pass every
+                # action_every ticks, then physics
+                decide = self.tick % max(1, settings.action_every) == 0
+                self.tick += 1
+                if decide:
+                    states = self.population_state.gather()
+                else:
+                    # Fitness reads the body arrays, which gather refreshes otherwise
+                    self.population_state.sync_bodies()
+                self.update_fitness()
+
+                if decide and self.physics_pool is not None:
+                    # Step physics on a worker thread while the policy runs on
+                    # the gathered states; the actions land one tick later
+                    physics = self.physics_pool.submit(self.space.step, PHYSICS_DT)
+                    with torch.inference_mode():
+                        actions = self.policy_forward(states)
+                    physics.result()
+                    self.population_state.apply_actions(actions, settings.max_motor_velocity)
+                else:
+                    if decide:
+                        with torch.inference_mode():
+                            actions = self.policy_forward(states)
+                        self.population_state.apply_actions(actions, settings.max_motor_velocity)
+                    self.space.step(PHYSICS_DT)
+
+            # Generations last a fixed number of ticks, whatever the machine
+            # speed or fast-forward factor
+            if self.tick >= round(settings.iteration_time / PHYSICS_DT):
+                self.next_generation()
 
-            # Update agents and physics
-            for agent in self.agents:
-                agent.update()
-            self.space.step(1/60.0)
+    def update_fitness(self):
+        """Compute all agents' fitness at once from the SoA body data"""
+        # Torso distance travelled; the torso is the first body of each agent
+        torso_x = self.population_state.bodies[::self.bodies_per_agent, 0]
+        np.subtract(torso_x, self.start_x, out=self.fitness_buf)
 
-            # Check if iteration is complete
-            if total_elapsed_time >= iteration_time:
-                self.next_generation()
+    def sync_fitness(self):
+        """Copy the fitness buffer back onto the agents"""
+        for agent, fitness in zip(self.agents, self.fitness_buf.tolist()):
+            agent.fitness = fitness
 
     def draw(self):
         """Render the game"""
@@ -286,58 +375,68 @@ class Game:
         self.draw_ui()
 
     def draw_agents(self):
-        """Draw all agents"""
-        enable_transparency = self.settings.get('enable_transparency')
-        
-        # Create surface for agents
-        if enable_transparency:
-            agent_surface = pygame.Surface(
-                (self.screen_width, self.screen_height), 
-                pygame.SRCALPHA
-            )
-        else:
-            agent_surface = self.screen
-
-        # Setup draw options
-        draw_options = CustomDrawOptions(
-            agent_surface,
-            self.agents,
-            self.best_agent,
-            enable_transparency
+        """Draw the ground and all agents"""
+        enable_transparency = self.settings.enable_transparency
+        offset_x = self.camera.offset_x
+        offset_y = self.camera.offset_y
+
+        self.draw_ground(offset_x, offset_y)
+
+        key = (self.best_agent, enable_transparency)
+        if self._agent_colors_key != key:
+            self._agent_colors_key = key
+            agent_color = TRANSPARENT_AGENT_COLOR if enable_transparency else AGENT_COLOR
+            self.agent_colors = [
+                BEST_AGENT_COLOR if agent is self.best_agent else agent_color
+                for agent in self.agents
+            ]
+
+        # Agents are pre-rendered sprites blitted in one batch
+        if self.population_state is None:
+            return
+        if self.parallel is None:
+            self.population_state.sync_bodies()
+        self.screen.blits(self.agent_sprites.blit_sequence(
+            self.population_state.positions,
+            self.population_state.angles,
+            self.agent_colors,
+            offset_x,
+            offset_y,
+            viewport=(self.screen_width, self.screen_height)
+        ), doreturn=False)
+
+    def draw_ground(self, offset_x, offset_y):
+        """Draw the static ground segment with the camera offset applied"""
+        (ax, ay), (bx, by) = self.ground_points
+        pygame.draw.line(
+            self.screen,
+            (0, 0, 0),
+            (ax + offset_x, ay + offset_y),
+            (bx + offset_x, by + offset_y),
+            self.ground_width
         )
 
-        # Apply camera transform
-        original_transform = draw_options.transform
-        draw_options.transform = original_transform.translated(
-            self.camera.offset.x,
-            self.camera.offset.y
-        )
-
-        # Draw physics objects
-        self.space.debug_draw(draw_options)
-        draw_options.transform = original_transform
-
-        # Blit agent surface if using transparency
-        if enable_transparency:
-            self.screen.blit(agent_surface, (0, 0))
-
     def draw_ui(self):
         """Draw UI elements"""
         self.gui.draw(self.screen)
-        
-        best_x = self.best_agent.get_position().x if self.best_agent else 0
-        offset = best_x - self.screen_width / 2
-        
         self.display_agent_info()
         self.display_iteration_timer()
 
+    def render_text(self, text):
+        """Render overlay text, reusing the surface while the text is unchanged"""
+        surf = self._text_cache.get(text)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = self.info_font.render(text, True, (0, 0, 0))
+            self._text_cache[text] = surf
+        return surf
+
     def display_agent_info(self):
         """Display agent statistics"""
-        font = pygame.font.SysFont(None, 24)
-        
         # Calculate average fitness
-        total_fitness = sum(agent.get_fitness() for agent in self.agents)
-        avg_fitness = total_fitness / len(self.agents) if self.agents else 0
+        avg_fitness = float(self.fitness_buf.mean()) if self.agents else 0
         
         # Render stats
         stats = [
@@ -346,42 +445,32 @@ class Game:
         ]
         
         for text, pos in stats:
-            surf = font.render(text, True, (0, 0, 0))
-            self.screen.blit(surf, pos)
+            self.screen.blit(self.render_text(text), pos)
 
     def display_iteration_timer(self):
-        """Display iteration timer with improved pause handling"""
-        font = pygame.font.SysFont(None, 24)
-        
-        if self.iteration_start_time is not None and self.settings.get('running'):
-            current_time = time.time()
-            total_elapsed_time = self.accumulated_time
-            
-            if self.paused:
-                if self.pause_start_time is not None:
-                    # When paused, don't add current time
-                    pass
-            else:
-                # When running, add the current period
-                total_elapsed_time += current_time - self.iteration_start_time
-            
-            time_left = max(0, self.settings.get('iteration_time') - total_elapsed_time)
+        """Display the simulated time left in the generation"""
+        if self.settings.running:
+            time_left = max(0, self.settings.iteration_time - self.tick * PHYSICS_DT)
             text = f"Iteration Time Left: {time_left:.1f}s"
         else:
             text = "Timer: Waiting to Start"
         
-        timer_text = font.render(text, True, (0, 0, 0))
+        timer_text = self.render_text(text)
         self.screen.blit(timer_text, (self.screen_width - 220, 50))
 
     def next_generation(self):
         """Handle generation transition with timer reset"""
         # Sort agents by fitness
-        self.agents.sort(key=lambda agent: agent.get_fitness(), reverse=True)
+        self.sync_fitness()
+        # Stable descending order, like list.sort(reverse=True)
+        order = np.argsort(-self.fitness_buf, kind='stable')
+        self.agents = [self.agents[i] for i in order.tolist()]
         self.best_agent = self.agents[0]
 
-        # Save best agent
+        # Save best agent in the background from an in-memory snapshot
         model_path = os.path.join('models', f'generation_{self.generation}.pth')
-        self.best_agent.save_model(model_path)
+        best_flat = self.best_agent.flat_params.clone()
+        self.io_pool.submit(self.best_agent.save_model, model_path, self.best_agent.state_dict())
 
         # Increment generation
         self.generation += 1
@@ -390,31 +479,28 @@ class Game:
         # Reset and mutate agents
         self.reset_agents()
         for agent in self.agents:
-            agent.load_model(model_path)
-            agent.mutate()
             agent.reset_position()
-        
-        # Reset timing variables for next generation
-        self.iteration_start_time = time.time()
-        self.accumulated_time = 0
-        self.pause_start_time = None
+        self.policy.broadcast(best_flat)
+        self.policy.mutate(self.settings.get('mutation_rate'))
 
     def load_generation(self):
         """Load a saved generation"""
         import tkinter as tk
         from tkinter import filedialog
 
-        root = tk.Tk()
-        root.withdraw()
+        # One hidden Tk root is kept for the game's lifetime
+        if self._tk_root is None:
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
         
         model_path = filedialog.askopenfilename(
+            parent=self._tk_root,
             initialdir="models",
             title="Select Model File",
             filetypes=(("PyTorch Models", "*.pth"), ("All Files", "*.*"))
         )
         
-        root.update()
-        root.destroy()
+        self._tk_root.update()
 
         if model_path and os.path.exists(model_path):
             try:
@@ -430,31 +516,11 @@ class Game:
                 for agent in self.agents:
                     agent.load_model(model_path)
                     agent.reset_position()
+                self.policy.refresh()
                     
-                # Reset timers
-                self.iteration_start_time = None
-                self.pause_start_time = None
-                self.accumulated_time = 0
                 self.paused = False
                     
             except (IndexError, ValueError) as e:
                 print(f"Error parsing generation number from file name: {e}")
         else:
             print("Invalid model path selected.")
-
-    def reset_agents(self):
-        """Reset all agents"""
-        for agent in self.agents:
-            agent.remove()
-        self.create_agents()
-
-    def create_agents(self):
-        """Create and initialize agents"""
-        self.agents = []
-        batch_size = self.settings.get('batch_size')
-        
-        for i in range(batch_size):
-            agent = Agent(self.space, self.settings, agent_id=i)
-            self.agents.append(agent)
-        
-        self.best_agent = None
@@ -0,0 +1,83 @@
+# src/game/sprites.py
+
+import math
+import numpy as np
+import pygame
+from ai.agent import BODY_PARTS
+
+# Rotated sprites are cached per ROTATION_STEP degrees
+ROTATION_STEP = 2
+ROTATION_BUCKETS = 360 // ROTATION_STEP
+# Agents reach at most this far from their torso
+CULL_MARGIN = 100
+
+
+class AgentSprites:
+    """
+    Pre-rendered, pre-rotated sprites for the agent body parts.
+
+    Every part of an agent is a box from BODY_PARTS, so instead of
+    rasterising each shape every frame the boxes are drawn once per colour and
+    rotated lazily into a per-angle cache. A frame then becomes a single
+    Surface.blits call over (sprite, position) pairs.
+    """
+
+    def __init__(self):
+        self.sizes = [size for _, _, size, _, _ in BODY_PARTS]
+        self.cache = {}
+
+    def sprite(self, part, color, angle):
+        """
+        Get the sprite of a body part rotated by a physics angle.
+
+        :param part: Index into BODY_PARTS.
+        :param color: RGB or RGBA colour of the part.
+        :param angle: Body angle in radians.
+        :return: Tuple of the rotated surface and its half extents.
+        """
+        bucket = int(round(math.degrees(angle) / ROTATION_STEP)) % ROTATION_BUCKETS
+        key = (part, color, bucket)
+        entry = self.cache.get(key)
+        if entry is None:
+            base = pygame.Surface(self.sizes[part], pygame.SRCALPHA)
+            base.fill(color)
+            # pymunk angles turn clockwise on screen, pygame rotates counter-clockwise
+            rotated = pygame.transform.rotate(base, -bucket * ROTATION_STEP)
+            entry = (rotated, rotated.get_width() / 2, rotated.get_height() / 2)
+            self.cache[key] = entry
+        return entry
+
+    def blit_sequence(self, positions, angles, colors, offset_x, offset_y, viewport=None):
+        """
+        Build the (sprite, destination) pairs for a set of bodies.
+
+        :param positions: (N_bodies, 2) array of body positions, agent-major.
+        :param angles: (N_bodies,) array of body angles.
+        :param colors: One colour per agent.
+        :param offset_x: Camera translation on the x axis.
+        :param offset_y: Camera translation on the y axis.
+        :param viewport: Optional (width, height) of the target; agents whose
+            torso is further than CULL_MARGIN outside it are skipped.
+        :return: List of (surface, (x, y)) tuples for Surface.blits.
+        """
+        num_parts = len(self.sizes)
+        rows = np.arange(len(positions))
+        if viewport is not None:
+            width, height = viewport
+            torso_x = positions[::num_parts, 0] + offset_x
+            torso_y = positions[::num_parts, 1] + offset_y
+            visible = (
+                (torso_x > -CULL_MARGIN) & (torso_x < width + CULL_MARGIN)
+                & (torso_y > -CULL_MARGIN) & (torso_y < height + CULL_MARGIN)
+            )
+            rows = rows.reshape(-1, num_parts)[visible].ravel()
+
+        sequence = []
+        for i, (x, y), angle in zip(rows.tolist(), positions[rows].tolist(), angles[rows].tolist()):
+            surface, half_w, half_h = self.sprite(i % num_parts, colors[i // num_parts], angle)
+            sequence.append((surface, (x + offset_x - half_w, y + offset_y - half_h)))
+        return sequence
+
+
+# Public Classes
+__all__ = ['AgentSprites']
@@ -0,0 +1,23 @@
+# src/game/world.py
+
+import pymunk
+
+# Define collision categories as class-level constants
+class CollisionCategory:
+    GROUND = 0b1
+    AGENT = 0b10
+
+def create_ground(space, ground_y):
+    """Add the static ground segment to a physics space"""
+    ground = pymunk.Segment(
+        space.static_body,
+        (-1000, ground_y),
+        (10000, ground_y),
+        5.0
+    )
+
+    ground.friction = 1.0
+    ground.elasticity = 0.0
+    ground.filter = pymunk.ShapeFilter(categories=CollisionCategory.GROUND)
+    space.add(ground)
+    return ground
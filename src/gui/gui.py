@@ -19,6 +19,8 @@ class GUI:
         self.stop_requested = False
         self.load_requested = False
         self.interacting = False
+        # Mouse position read by the last update()
+        self.mouse_pos = None
         
         # Initialize constants and scaling factors
         self.init_dimensions()
@@ -26,8 +28,6 @@ class GUI:
         # Initialize UI elements
         self.font = pygame.font.SysFont(None, self.font_size)
         self.settings_menu = SettingsMenu(settings, screen)  # Pass screen to SettingsMenu
-        self.buttons = []
-        self.create_buttons()
         
         # Button colors
         self.colors = {
@@ -38,6 +38,8 @@ class GUI:
             'text': (40, 40, 40),
             'text_active': (255, 255, 255)
         }
+        self.buttons = []
+        self.create_buttons()
 
     def init_dimensions(self):
         """Initialize responsive dimensions based on screen size."""
@@ -95,9 +97,49 @@ class GUI:
                 ),
                 "hovered": False
             }
+            self.render_button(button)
             self.buttons.append(button)
             button_y += self.button_spacing
 
+    def render_button(self, button):
+        """
+        Pre-render a button's faces and tooltip so drawing is a plain blit.
+
+        :param button: Button dictionary created by create_buttons.
+        """
+        width, height = button["rect"].size
+        local_rect = pygame.Rect(0, 0, width, height)
+        faces = {}
+        for state, color, text_color in (
+            ('active', self.colors['active'], self.colors['text_active']),
+            ('hover', self.colors['hover'], self.colors['text']),
+            ('inactive', self.colors['inactive'], self.colors['text'])
+        ):
+            # Room for the shadow offset
+            face = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+            pygame.draw.rect(face, (160, 160, 160), local_rect.move(2, 2), 0, self.corner_radius)
+            pygame.draw.rect(face, color, local_rect, 0, self.corner_radius)
+            pygame.draw.rect(face, self.colors['border'], local_rect, 2, self.corner_radius)
+            text_surf = self.font.render(button["text"], True, text_color)
+            face.blit(text_surf, text_surf.get_rect(center=local_rect.center))
+            faces[state] = face
+        button["faces"] = faces
+
+        tooltip_text = self.font.render(button["tooltip"], True, self.colors['text'])
+        padding = 5
+        bg_rect = tooltip_text.get_rect().inflate(padding * 2, padding * 2)
+        bg_rect.topleft = (0, 0)
+        tooltip = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(tooltip, (245, 245, 245), bg_rect, 0, 3)
+        pygame.draw.rect(tooltip, self.colors['border'], bg_rect, 1, 3)
+        tooltip.blit(tooltip_text, (padding, padding))
+        button["tooltip_surf"] = tooltip
+        # Tooltip sits 10px right of the button, vertically centered
+        button["tooltip_pos"] = (
+            button["rect"].right + 10 - padding,
+            button["rect"].centery - bg_rect.height // 2
+        )
+
     def resize(self, screen_width, screen_height):
         """
         Handle window resize events.
@@ -107,10 +149,8 @@ class GUI:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.screen = pygame.display.set_mode(
-            (screen_width, screen_height),
-            pygame.RESIZABLE
-        )
+        # The game has already resized the window; just pick up its surface
+        self.screen = pygame.display.get_surface()
         self.init_dimensions()
         self.font = pygame.font.SysFont(None, self.font_size)
         self.create_buttons()
@@ -122,50 +162,32 @@ class GUI:
 
         :param screen: The Pygame screen surface.
         """
-        mouse_pos = pygame.mouse.get_pos()
-        
+        mouse_pos = self.mouse_pos if self.mouse_pos is not None else pygame.mouse.get_pos()
+        running = self.settings.running
+        blit_list = []
+        tooltips = []
+
         # Draw buttons
         for button in self.buttons:
             # Update hover state
             button["hovered"] = button["rect"].collidepoint(mouse_pos)
-            
-            # Determine button color
-            if button["text"] == "Start" and self.settings.get('running'):
-                color = self.colors['active']
-                text_color = self.colors['text_active']
+
+            # Determine button face
+            if button["text"] == "Start" and running:
+                state = 'active'
             elif button["text"] == "Pause" and self.pause_requested:
-                color = self.colors['active']
-                text_color = self.colors['text_active']
+                state = 'active'
             else:
-                color = self.colors['hover'] if button["hovered"] else self.colors['inactive']
-                text_color = self.colors['text']
+                state = 'hover' if button["hovered"] else 'inactive'
+            blit_list.append((button["faces"][state], button["rect"].topleft))
 
-            # Draw button background with shadow
-            shadow_rect = button["rect"].copy()
-            shadow_rect.move_ip(2, 2)
-            pygame.draw.rect(screen, (160, 160, 160), shadow_rect, 0, self.corner_radius)
-            
-            # Draw main button
-            pygame.draw.rect(screen, color, button["rect"], 0, self.corner_radius)
-            pygame.draw.rect(screen, self.colors['border'], button["rect"], 2, self.corner_radius)
-
-            # Draw button text
-            text_surf = self.font.render(button["text"], True, text_color)
-            text_rect = text_surf.get_rect(center=button["rect"].center)
-            screen.blit(text_surf, text_rect)
-
-            # Draw tooltip if hovered
+            # Draw tooltip if hovered, after all buttons
             if button["hovered"]:
-                tooltip_text = self.font.render(button["tooltip"], True, self.colors['text'])
-                tooltip_rect = tooltip_text.get_rect()
-                tooltip_rect.midleft = (button["rect"].right + 10, button["rect"].centery)
-                
-                # Draw tooltip background
-                padding = 5
-                bg_rect = tooltip_rect.inflate(padding * 2, padding * 2)
-                pygame.draw.rect(screen, (245, 245, 245), bg_rect, 0, 3)
-                pygame.draw.rect(screen, self.colors['border'], bg_rect, 1, 3)
-                screen.blit(tooltip_text, tooltip_rect)
+                tooltips.append((button["tooltip_surf"], button["tooltip_pos"]))
+
+        screen.blits(blit_list, doreturn=False)
+        if tooltips:
+            screen.blits(tooltips, doreturn=False)
 
         # Draw settings menu if visible
         if self.settings_menu.visible:
@@ -201,8 +223,10 @@ class GUI:
 
         :param time_delta: Time elapsed since the last frame.
         """
-        if self.settings_menu.visible:
-            self.settings_menu.update()
+        # Mouse state is polled once per frame and shared with draw()
+        self.mouse_pos = pygame.mouse.get_pos()
+        # The menu also collects dialog results while hidden
+        self.settings_menu.update(self.mouse_pos, pygame.mouse.get_pressed())
 
     def is_interacting(self):
         """
@@ -221,7 +245,7 @@ class GUI:
 
     def pause_simulation(self):
         """Toggle pause/resume of the simulation."""
-        if self.settings.get('running'):
+        if self.settings.running:
             self.pause_requested = not self.pause_requested
         self.interacting = False
 
@@ -1,13 +1,29 @@
 # src/gui/settings_menu.py
 
 import pygame
+import functools
+import queue
+import shutil
 import threading
-import subprocess
 import tkinter as tk
 from tkinter import filedialog
-from src.utils.recorder import ScreenRecorder
+from src.utils.recorder import ScreenRecorder, probe_video_encoder
 from config.settings import Settings
 
+# Number of rendered strings kept around
+TEXT_CACHE_SIZE = 256
+# Color key for the transparent parts of pre-rendered surfaces; never
+# used by the menu itself
+TRANSPARENT_KEY = (255, 0, 255)
+# Number of pre-rendered rounded rectangles kept around; slider fills
+# come in many widths
+RRECT_CACHE_SIZE = 512
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_installed():
+    """Check once per process whether FFmpeg is on the PATH, without spawning it."""
+    return shutil.which('ffmpeg') is not None
+
 class SettingsMenu:
     def __init__(self, settings: Settings, screen):
         """
@@ -37,9 +53,30 @@ class SettingsMenu:
         ]
         self.active_tab = 0
         self.dragging = None
+        # Slider settings changed during the current drag
+        self._pending_settings = {}
+        # Mouse state the hover flags were last computed for
+        self._hover_state = None
+        # Mouse position read by the last update()
+        self._mouse_pos = None
+        # Pre-rendered static panel per (active tab, hovered tab), rebuilt
+        # after a resize
+        self._panels = {}
+        # Pre-rendered rounded rectangles keyed by size, colors and shape
+        self._rrect_cache = {}
 
         # Initialize recorder
         self.recorder = None
+        if ffmpeg_installed():
+            # Pick the video encoder in the background, so the first recording doesn't wait for it
+            probe_video_encoder()
+
+        # Folder dialogs run on one long-lived thread that owns a hidden Tk
+        # root; requests go to it and results come back through queues
+        self._folder_requests = queue.Queue()
+        self._folder_results = queue.Queue()
+        self._folder_thread = None
+        self._folder_dialog_open = False
 
         # Create controls
         self.create_controls()
@@ -97,180 +134,352 @@ class SettingsMenu:
         self.font = pygame.font.SysFont(None, base_font_size)
         self.title_font = pygame.font.SysFont(None, int(base_font_size * 1.2))
         self.popup_font = pygame.font.SysFont(None, int(base_font_size * 1.1))
+        # Rendered text and its half extents keyed by (font, text, color);
+        # reset with the fonts
+        self._text_cache = {}
+        # Shortened folder paths keyed by (path, width)
+        self._path_cache = {}
+
+    def render_text(self, text, color, font=None):
+        """
+        Render text, reusing the surface while text, color and font are unchanged.
+
+        :param text: The string to render.
+        :param color: Text color.
+        :param font: Font to render with; defaults to the menu font.
+        :return: The rendered surface.
+        """
+        return self.cached_text(text, color, font)[0]
+
+    def cached_text(self, text, color, font=None):
+        """
+        Look up or render a text surface along with its half extents.
+
+        :param text: The string to render.
+        :param color: Text color.
+        :param font: Font to render with; defaults to the menu font.
+        :return: Tuple of the surface, half its width and half its height.
+        """
+        font = font or self.font
+        key = (id(font), text, color)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(text, True, color)
+            entry = (surf, surf.get_width() // 2, surf.get_height() // 2)
+            self._text_cache[key] = entry
+        return entry
+
+    def blit_text_centered(self, surface, text, color, center):
+        """
+        Draw cached text centered on a point.
+
+        :param surface: Surface to draw on.
+        :param text: The string to render.
+        :param color: Text color.
+        :param center: (x, y) center of the text.
+        """
+        surf, half_w, half_h = self.cached_text(text, color)
+        surface.blit(surf, (center[0] - half_w, center[1] - half_h))
 
     def create_controls(self):
-        """Create sliders and toggles for each tab."""
+        """Create sliders and toggles for each tab, laid out one row apart."""
+        rows = [self.content_y_start + i * self.control_spacing for i in range(3)]
         self.tabs[0]["controls"] = [
-            self.create_slider("Learning Rate", 0.0001, 0.01, self.settings.get('learning_rate'), 4),
-            self.create_slider("Hidden Size", 32, 512, float(self.settings.get('hidden_size')), 0),
-            self.create_slider("Mutation Rate", 0.01, 0.5, self.settings.get('mutation_rate'), 4)
+            self.create_slider("Learning Rate", 'learning_rate', 0.0001, 0.01, 4, rows[0]),
+            self.create_slider("Hidden Size", 'hidden_size', 32, 512, 0, rows[1], int),
+            self.create_slider("Mutation Rate", 'mutation_rate', 0.01, 0.5, 4, rows[2])
         ]
         self.tabs[1]["controls"] = [
-            self.create_slider("Gravity", 0.0, 2000.0, self.settings.get('gravity'), 2),
-            self.create_slider("Max Torque", 0.0, 100000.0, self.settings.get('max_torque'), 1),
-            self.create_slider("Max Motor Velocity", 0.0, 20.0, self.settings.get('max_motor_velocity'), 1)
+            self.create_slider("Gravity", 'gravity', 0.0, 2000.0, 2, rows[0]),
+            self.create_slider("Max Torque", 'max_torque', 0.0, 100000.0, 1, rows[1]),
+            self.create_slider("Max Motor Velocity", 'max_motor_velocity', 0.0, 20.0, 1, rows[2])
         ]
         self.tabs[2]["controls"] = [
-            self.create_slider("Batch Size", 8, 128, float(self.settings.get('batch_size')), 0),
-            self.create_slider("Iteration Time", 10, 120, float(self.settings.get('iteration_time')), 0)
+            self.create_slider("Batch Size", 'batch_size', 8, 128, 0, rows[0], int),
+            self.create_slider("Iteration Time", 'iteration_time', 10, 120, 0, rows[1], int)
         ]
         self.tabs[3]["controls"] = [
-            self.create_toggle("Enable Transparency", self.settings.get('enable_transparency')),
-            self.create_toggle("Enable Recording", self.settings.get('enable_recording')),
-            self.create_folder_selector("Video Output Folder", self.settings.get('video_output_folder'))
+            self.create_toggle("Enable Transparency", 'enable_transparency', rows[0]),
+            self.create_toggle("Enable Recording", 'enable_recording', rows[1]),
+            self.create_folder_selector("Video Output Folder", self.settings.get('video_output_folder'), rows[2])
         ]
 
-    def create_slider(self, label, min_val, max_val, current_val, decimal_places):
-        """Create a slider control."""
-        value_str = f"{current_val:.{decimal_places}f}" if decimal_places > 0 else str(int(current_val))
-        return {
+    def create_slider(self, label, setting_key, min_val, max_val, decimal_places, y, setting_type=float):
+        """
+        Create a slider control bound to a setting.
+
+        :param label: Text shown above the slider.
+        :param setting_key: Settings key the slider edits.
+        :param min_val: Minimum value.
+        :param max_val: Maximum value.
+        :param decimal_places: Decimal places shown and kept.
+        :param y: Top of the slider within the menu.
+        :param setting_type: Type the value is stored as.
+        """
+        current_val = float(self.settings.get(setting_key))
+        # Dragging only formats the value, the rest of the text is fixed
+        label_prefix = f"{label}: "
+        # Values sit on an integer grid of the shown decimal places
+        scale = 10 ** decimal_places
+        value_format = f"{{:.{decimal_places}f}}" if decimal_places > 0 else "{:d}"
+        rect = pygame.Rect(self.padding, y, self.slider_width, self.slider_height)
+        control = {
             "type": "slider",
             "label": label,
             "min": min_val,
             "max": max_val,
             "value": current_val,
             "decimal_places": decimal_places,
-            "rect": pygame.Rect(self.padding, 0, self.slider_width, self.slider_height),
+            "scale": scale,
+            "step_base": round(min_val * scale),
+            "steps": round((max_val - min_val) * scale),
+            "setting_key": setting_key,
+            "setting_type": setting_type,
+            "rect": rect,
+            # Screen-space copy, so drawing and hit tests need no offsets
+            "abs_rect": rect.move(self.pos),
             "handle_rect": pygame.Rect(0, 0, self.handle_width, self.handle_height),
-            "text": f"{label}: {value_str}",
+            "abs_handle_rect": pygame.Rect(0, 0, self.handle_width, self.handle_height),
+            "label_prefix": label_prefix,
+            "value_format": value_format,
+            "text": label_prefix + value_format.format(current_val if decimal_places > 0 else int(current_val)),
             "active": False,
             "hovered": False
         }
+        # Set initial handle position based on current value
+        self.update_handle(control)
+        return control
 
-    def create_toggle(self, label, value):
-        """Create a toggle control."""
+    def create_toggle(self, label, setting_key, y):
+        """
+        Create a toggle control bound to a setting.
+
+        :param label: Text shown above the toggle.
+        :param setting_key: Settings key the toggle switches.
+        :param y: Top of the toggle within the menu.
+        """
+        value = self.settings.get(setting_key)
+        rect = pygame.Rect(
+            self.padding,
+            y,
+            min(int(self.width * 0.2), 140),
+            max(int(self.height * 0.06), 32)
+        )
         return {
             "type": "toggle",
             "label": label,
             "value": value,
-            "rect": pygame.Rect(
-                self.padding,
-                0,
-                min(int(self.width * 0.2), 140),
-                max(int(self.height * 0.06), 32)
-            ),
+            "setting_key": setting_key,
+            "rect": rect,
+            "abs_rect": rect.move(self.pos),
             "text": "On" if value else "Off",
             "hovered": False
         }
 
-    def create_folder_selector(self, label, current_folder):
-        """Create a folder selector control."""
+    def create_folder_selector(self, label, current_folder, y):
+        """Create a folder selector control with its top at y within the menu."""
+        rect = pygame.Rect(
+            self.padding,
+            y,
+            min(int(self.width * 0.6), 200),
+            max(int(self.height * 0.06), 32)
+        )
+        # Position the "Browse" button next to the path display
+        button_rect = pygame.Rect(rect.right + 10, rect.y, 80, 32)
+        path_width = rect.width - button_rect.width - 20
+        abs_rect = rect.move(self.pos)
         return {
             "type": "folder_selector",
             "label": label,
             "current_folder": current_folder,
-            "rect": pygame.Rect(
-                self.padding,
-                0,
-                min(int(self.width * 0.6), 200),
-                max(int(self.height * 0.06), 32)
-            ),
-            "button_rect": pygame.Rect(0, 0, 80, 32),
+            "rect": rect,
+            "abs_rect": abs_rect,
+            "button_rect": button_rect,
+            "abs_path_rect": pygame.Rect(abs_rect.x, abs_rect.y, path_width, rect.height),
+            "abs_button_rect": button_rect.move(self.pos[0] + path_width + 10, self.pos[1]),
             "hovered": False
         }
 
     def update_control_positions(self):
-        """Update the positions of controls within each tab."""
+        """Build the tab, close button and hit-test rects; controls are placed when created."""
+        for tab in self.tabs:
+            # The rect that decides each control's hover state: the handle of
+            # a slider, the Browse button of a folder selector, else the control
+            tab["hover_targets"] = [
+                (control["abs_handle_rect"] if control["type"] == "slider" else
+                 control["abs_button_rect"] if control["type"] == "folder_selector" else
+                 control["abs_rect"], control)
+                for control in tab["controls"]
+            ]
+
+        tab_width = self.width // len(self.tabs)
+        self._tab_rects = [
+            pygame.Rect(self.pos[0] + (i * tab_width), self.pos[1], tab_width, self.tab_height)
+            for i in range(len(self.tabs))
+        ]
+        close_size = (min(int(self.width * 0.15), 90), min(int(self.height * 0.08), 36))
+        self._close_rect = pygame.Rect(self.pos[0] + self.width - close_size[0] - self.padding,
+                                       self.pos[1] + self.height - close_size[1] - self.padding, *close_size)
+        self._menu_rect = pygame.Rect(self.pos[0], self.pos[1], self.width, self.height)
+
+        # What a click hits, in priority order: tabs, the close button, then the tab's controls
+        common_targets = [
+            (tab_rect, functools.partial(self.press_tab, i)) for i, tab_rect in enumerate(self._tab_rects)
+        ]
+        common_targets.append((self._close_rect, self.press_close))
         for tab in self.tabs:
-            current_y = self.content_y_start
+            tab["hit_targets"] = list(common_targets)
             for control in tab["controls"]:
-                control["rect"].y = current_y
                 if control["type"] == "slider":
-                    # Set initial handle position based on current value
-                    handle_x = (control["rect"].x +
-                              (control["rect"].width *
-                               (control["value"] - control["min"]) /
-                               (control["max"] - control["min"])))
-                    control["handle_rect"].centerx = handle_x
-                    control["handle_rect"].centery = control["rect"].centery
+                    press = functools.partial(self.press_slider, control)
+                    tab["hit_targets"] += [(control["abs_handle_rect"], press), (control["abs_rect"], press)]
+                elif control["type"] == "toggle":
+                    tab["hit_targets"].append((control["abs_rect"], functools.partial(self.press_toggle, control)))
                 elif control["type"] == "folder_selector":
-                    # Position the "Browse" button next to the path display
-                    control["button_rect"].x = control["rect"].right + 10
-                    control["button_rect"].y = control["rect"].y
-                current_y += self.control_spacing
+                    tab["hit_targets"].append((control["abs_button_rect"], self.press_browse))
+
+    def update_handle(self, control):
+        """
+        Move a slider's handle to match its value.
+
+        :param control: The slider control.
+        """
+        rect = control["rect"]
+        value_ratio = (control["value"] - control["min"]) / (control["max"] - control["min"])
+        handle_rect = control["handle_rect"]
+        handle_rect.center = (rect.x + int(rect.width * value_ratio), rect.centery)
+        # Moved in place, since the tab's hover table refers to it
+        control["abs_handle_rect"].topleft = (
+            handle_rect.x + self.pos[0], handle_rect.y + self.pos[1]
+        )
+
+    def update(self, mouse_pos=None, mouse_buttons=None):
+        """
+        Update the settings menu state.
 
-    def update(self):
-        """Update the settings menu state."""
+        :param mouse_pos: Mouse position polled this frame; polled here if None.
+        :param mouse_buttons: Mouse button states polled this frame; polled here if None.
+        """
+        # The queue is only read while a dialog is open, so a hidden menu costs two checks
+        if self._folder_dialog_open:
+            self.apply_folder_results()
         if not self.visible:
             return
 
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        if mouse_buttons is None:
+            mouse_buttons = pygame.mouse.get_pressed()
+        # Reused by draw() this frame
+        self._mouse_pos = mouse_pos
 
         # If mouse button is not pressed, release any dragging
         if not mouse_buttons[0]:
-            if self.dragging:
-                self.dragging["active"] = False
-                self.dragging = None
+            self.release_dragging()
 
-        # Update hover states and handle dragging
-        for control in self.tabs[self.active_tab]["controls"]:
-            control_rect = control["rect"].copy()
-            control_rect.x += self.pos[0]
-            control_rect.y += self.pos[1]
+        # Hover states only change when the mouse, the button or the tab do
+        hover_state = (mouse_pos, mouse_buttons[0], self.active_tab)
+        if self.dragging is None and hover_state == self._hover_state:
+            return
+        self._hover_state = hover_state
 
-            if control["type"] == "slider":
-                handle_rect = control["handle_rect"].copy()
-                handle_rect.x += self.pos[0]
-                handle_rect.y += self.pos[1]
-                control["hovered"] = handle_rect.collidepoint(mouse_pos)
-
-                if self.dragging == control:
-                    self.update_slider_value(mouse_pos[0], control)
-                    self.update_control_positions()
-            elif control["type"] == "folder_selector":
-                # Update hover state for the browse button
-                button_rect = control["button_rect"].copy()
-                button_rect.x += self.pos[0] + control["rect"].width + 10
-                button_rect.y += self.pos[1]
-                control["hovered"] = button_rect.collidepoint(mouse_pos)
-            else:
-                control["hovered"] = control_rect.collidepoint(mouse_pos)
+        # Update hover states and handle dragging
+        for rect, control in self.tabs[self.active_tab]["hover_targets"]:
+            control["hovered"] = rect.collidepoint(mouse_pos)
+        if self.dragging is not None:
+            self.update_slider_value(mouse_pos[0], self.dragging)
 
     def draw(self, screen):
         """Render the settings menu and any active popups."""
         if not self.visible:
             return
 
-        # Draw main menu with drop shadow
-        mouse_pos = pygame.mouse.get_pos()
-        shadow_rect = pygame.Rect(self.pos[0] + 3, self.pos[1] + 3, self.width, self.height)
-        pygame.draw.rect(screen, self.colors['shadow'], shadow_rect, border_radius=self.corner_radius)
-        menu_rect = pygame.Rect(self.pos[0], self.pos[1], self.width, self.height)
-        pygame.draw.rect(screen, self.colors['bg'], menu_rect, border_radius=self.corner_radius)
-        pygame.draw.rect(screen, self.colors['border'], menu_rect, 2, border_radius=self.corner_radius)
-        self.draw_tabs(screen, mouse_pos)
+        # The panel with its shadow, tabs and labels is pre-rendered per tab
+        # and hovered tab; only the parts that react to values are drawn live
+        mouse_pos = self._mouse_pos if self._mouse_pos is not None else pygame.mouse.get_pos()
+        screen.blit(self.get_panel(self.active_tab, self.hovered_tab(mouse_pos)), self.pos)
         self.draw_controls(screen, mouse_pos)
         self.draw_close_button(screen, mouse_pos)
 
-        # Draw popup if active
-        if self.popup:
-            self.draw_popup(screen)
+        # Draw popup if active; read once, recorder callbacks replace it from another thread
+        popup = self.popup
+        if popup:
+            self.draw_popup(screen, popup)
+
+        # Area touched this frame, for callers that update the display by rects
+        return [pygame.Rect(self.pos[0], self.pos[1], self.width + 3, self.height + 3)]
+
+    def hovered_tab(self, mouse_pos):
+        """
+        Find the inactive tab under the mouse.
+
+        :param mouse_pos: Mouse position.
+        :return: Index of the hovered tab, or None.
+        """
+        for i, tab_rect in enumerate(self._tab_rects):
+            if i != self.active_tab and tab_rect.collidepoint(mouse_pos):
+                return i
+        return None
+
+    def get_panel(self, tab_index, hovered_tab=None):
+        """
+        Get the pre-rendered static part of the menu for a tab.
+
+        :param tab_index: Index of the active tab.
+        :param hovered_tab: Index of the highlighted inactive tab, or None.
+        :return: Surface with the shadow, background, border, tabs, labels and
+            the parts of the controls that only change with a setting.
+        """
+        key = (tab_index, hovered_tab)
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = self.keyed_surface(self.width + 3, self.height + 3)
+            pygame.draw.rect(panel, self.colors['shadow'], pygame.Rect(3, 3, self.width, self.height),
+                             border_radius=self.corner_radius)
+            menu_rect = pygame.Rect(0, 0, self.width, self.height)
+            pygame.draw.rect(panel, self.colors['bg'], menu_rect, border_radius=self.corner_radius)
+            pygame.draw.rect(panel, self.colors['border'], menu_rect, 2, border_radius=self.corner_radius)
+            for i in range(len(self.tabs)):
+                color = (self.colors['tab']['active'] if i == tab_index else
+                         (self.colors['tab']['hover'] if i == hovered_tab else
+                          self.colors['tab']['inactive']))
+                self.draw_tab(panel, i, color)
+            for control in self.tabs[tab_index]["controls"]:
+                label = self.render_text(control["label"], self.colors['text'])
+                panel.blit(label, (control["rect"].x, control["rect"].y - 30))
+                if control["type"] == "slider":
+                    # The fill and handle are drawn over the track live
+                    self.draw_rounded_rect(panel, control["rect"], self.colors['slider']['track'], radius=3)
+                elif control["type"] == "folder_selector":
+                    self.draw_folder_path(panel, control, control["abs_path_rect"].move(-self.pos[0], -self.pos[1]))
+            self._panels[key] = panel
+        return panel
+
+    def draw_tab(self, surface, index, color):
+        """
+        Draw a single tab onto a panel.
 
-    def draw_tabs(self, screen, mouse_pos):
-        """Draw the tabs for different settings categories."""
+        :param surface: Panel surface to draw on.
+        :param index: Index of the tab.
+        :param color: Fill color of the tab.
+        """
         tab_width = self.width // len(self.tabs)
-        for i, tab in enumerate(self.tabs):
-            tab_rect = pygame.Rect(self.pos[0] + (i * tab_width), self.pos[1], tab_width, self.tab_height)
-            color = (self.colors['tab']['active'] if i == self.active_tab else
-                    (self.colors['tab']['hover'] if tab_rect.collidepoint(mouse_pos) else
-                     self.colors['tab']['inactive']))
-            pygame.draw.rect(screen, color, tab_rect, border_radius=0)
-            if i < len(self.tabs) - 1:
-                pygame.draw.line(screen, self.colors['border'],
-                               (tab_rect.right, tab_rect.top),
-                               (tab_rect.right, tab_rect.bottom))
-            text = self.font.render(tab["name"], True, self.colors['text'])
-            text_rect = text.get_rect(center=tab_rect.center)
-            screen.blit(text, text_rect)
+        tab_rect = pygame.Rect(index * tab_width, 0, tab_width, self.tab_height)
+        pygame.draw.rect(surface, color, tab_rect, border_radius=0)
+        if index < len(self.tabs) - 1:
+            pygame.draw.line(surface, self.colors['border'],
+                           (tab_rect.right, tab_rect.top),
+                           (tab_rect.right, tab_rect.bottom))
+        self.blit_text_centered(surface, self.tabs[index]["name"], self.colors['text'], tab_rect.center)
 
     def draw_controls(self, screen, mouse_pos):
         """Draw the controls for the active tab."""
         active_tab = self.tabs[self.active_tab]
         for control in active_tab["controls"]:
-            control_rect = control["rect"].copy()
-            control_rect.x += self.pos[0]
-            control_rect.y += self.pos[1]
+            control_rect = control["abs_rect"]
 
             if control["type"] == "slider":
                 self.draw_slider(screen, control, control_rect)
@@ -281,127 +490,221 @@ class SettingsMenu:
 
     def draw_slider(self, screen, control, slider_rect):
         """Render a slider control."""
-        # Draw label above the slider
-        label = self.font.render(control["label"], True, self.colors['text'])
-        screen.blit(label, (slider_rect.x, slider_rect.y - 30))
-
-        # Draw slider track
-        pygame.draw.rect(screen, self.colors['slider']['track'], slider_rect, 0, 3)
-
+        # The label above it and the track are part of the pre-rendered panel
         # Calculate filled portion
         value_ratio = (control["value"] - control["min"]) / (control["max"] - control["min"])
-        filled_rect = slider_rect.copy()
-        filled_rect.width = max(6, int(filled_rect.width * value_ratio))
-        pygame.draw.rect(screen, self.colors['slider']['fill'], filled_rect, 0, 3)
-
-        # Draw slider handle
-        handle_x = slider_rect.x + int(slider_rect.width * value_ratio)
-        handle_rect = control["handle_rect"].copy()
-        handle_rect.centerx, handle_rect.centery = handle_x, slider_rect.centery
+        filled_width = max(6, int(slider_rect.width * value_ratio))
+        self.draw_rounded_rect(screen, (slider_rect.x, slider_rect.y, filled_width, slider_rect.height),
+                               self.colors['slider']['fill'], radius=3)
+
+        # Draw slider handle, kept in place by update_handle
+        handle_rect = control["abs_handle_rect"]
         handle_color = (self.colors['slider']['handle'] if control.get("active")
                        else self.colors['slider']['handle_hover'])
-        pygame.draw.rect(screen, handle_color, handle_rect, 0, 4)
-        pygame.draw.rect(screen, self.colors['border'], handle_rect, 2, 4)
+        self.draw_rounded_rect(screen, handle_rect, handle_color, self.colors['border'], radius=4)
 
         # Draw current value next to the slider
         value_text = f"{control['value']:.{control['decimal_places']}f}" if control["decimal_places"] > 0 else str(int(control["value"]))
-        value_surf = self.font.render(value_text, True, self.colors['text'])
+        value_surf = self.render_text(value_text, self.colors['text'])
         value_rect = value_surf.get_rect(midleft=(slider_rect.right + 10, slider_rect.centery))
         screen.blit(value_surf, value_rect)
 
     def draw_toggle(self, screen, control, toggle_rect):
         """Render a toggle control."""
-        # Draw label above the toggle
-        label = self.font.render(control["label"], True, self.colors['text'])
-        screen.blit(label, (toggle_rect.x, toggle_rect.y - 30))
-
         # Draw toggle switch
         color = self.colors['toggle']['on'] if control["value"] else self.colors['toggle']['off']
-        pygame.draw.rect(screen, color, toggle_rect, 0, 6)
-        pygame.draw.rect(screen, self.colors['toggle']['border'], toggle_rect, 2, 6)
+        self.draw_rounded_rect(screen, toggle_rect, color, self.colors['toggle']['border'])
 
         # Draw toggle state text
-        text = self.font.render(control["text"], True,
-                              self.colors['text_light'] if control["value"] else self.colors['text'])
-        text_rect = text.get_rect(center=toggle_rect.center)
-        screen.blit(text, text_rect)
+        self.blit_text_centered(screen, control["text"],
+                                self.colors['text_light'] if control["value"] else self.colors['text'],
+                                toggle_rect.center)
 
     def draw_folder_selector(self, screen, control, folder_rect):
-        """Render a folder selector control."""
-        # Draw label above the folder selector
-        label = self.font.render(control["label"], True, self.colors['text'])
-        screen.blit(label, (folder_rect.x, folder_rect.y - 30))
-
-        # Draw the current folder path inside a box
-        path_rect = pygame.Rect(folder_rect.x, folder_rect.y, folder_rect.width - control["button_rect"].width - 20, folder_rect.height)
-        pygame.draw.rect(screen, (255, 255, 255), path_rect, 0, 6)
-        pygame.draw.rect(screen, self.colors['border'], path_rect, 2, 6)
-        folder_text = self.font.render(self.shorten_path(control["current_folder"], path_rect.width - 10), True, self.colors['text'])
-        folder_text_rect = folder_text.get_rect(midleft=(path_rect.x + 10, path_rect.centery))
-        screen.blit(folder_text, folder_text_rect)
-
+        """Render a folder selector control; its path box is part of the pre-rendered panel."""
         # Draw the browse button next to the path
-        button_rect = control["button_rect"].copy()
-        button_rect.x += self.pos[0] + path_rect.width + 10  # Adjusted positioning
-        button_rect.y += self.pos[1]
+        button_rect = control["abs_button_rect"]
         button_color = self.colors['toggle']['on'] if control["hovered"] else self.colors['toggle']['off']
-        pygame.draw.rect(screen, button_color, button_rect, 0, 6)
-        pygame.draw.rect(screen, self.colors['toggle']['border'], button_rect, 2, 6)
-        button_text = self.font.render("Browse", True, self.colors['text_light'])
-        button_text_rect = button_text.get_rect(center=button_rect.center)
-        screen.blit(button_text, button_text_rect)
+        self.draw_rounded_rect(screen, button_rect, button_color, self.colors['toggle']['border'])
+        self.blit_text_centered(screen, "Browse", self.colors['text_light'], button_rect.center)
+
+    def draw_folder_path(self, surface, control, path_rect):
+        """
+        Draw the current folder path of a folder selector inside a box.
+
+        :param surface: Surface to draw on.
+        :param control: The folder selector control.
+        :param path_rect: Rect of the path box on the surface.
+        """
+        self.draw_rounded_rect(surface, path_rect, (255, 255, 255), self.colors['border'])
+        folder_text = self.render_text(self.shorten_path(control["current_folder"], path_rect.width - 10), self.colors['text'])
+        folder_text_rect = folder_text.get_rect(midleft=(path_rect.x + 10, path_rect.centery))
+        surface.blit(folder_text, folder_text_rect)
+
+    def keyed_surface(self, width, height):
+        """
+        Create a surface whose untouched pixels are transparent via a color key.
+
+        Color-keyed blits are much cheaper than per-pixel alpha and the menu
+        only needs fully opaque or fully transparent pixels.
+
+        :param width: Surface width.
+        :param height: Surface height.
+        :return: Surface filled with the transparent key color.
+        """
+        surface = pygame.Surface((width, height))
+        surface.fill(TRANSPARENT_KEY)
+        surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+        return surface
+
+    def draw_rounded_rect(self, surface, rect, color, border_color=None, radius=6, border_width=2):
+        """
+        Draw a filled rounded rectangle with an optional border from a cached surface.
+
+        :param surface: Surface to draw on.
+        :param rect: Rect or (x, y, width, height) tuple.
+        :param color: Fill color.
+        :param border_color: Border color, or None for no border.
+        :param radius: Corner radius.
+        :param border_width: Border thickness.
+        """
+        x, y, width, height = rect
+        key = (width, height, color, border_color, radius, border_width)
+        box = self._rrect_cache.get(key)
+        if box is None:
+            if len(self._rrect_cache) >= RRECT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._rrect_cache[next(iter(self._rrect_cache))]
+            box = self.keyed_surface(width, height)
+            local_rect = pygame.Rect(0, 0, width, height)
+            pygame.draw.rect(box, color, local_rect, 0, radius)
+            if border_color is not None:
+                pygame.draw.rect(box, border_color, local_rect, border_width, radius)
+            self._rrect_cache[key] = box
+        surface.blit(box, (x, y))
 
     def shorten_path(self, path, max_width):
         """Shorten the folder path to fit within a given width."""
-        font = self.font
-        text = path
-        while font.size(text)[0] > max_width and len(text) > 3:
-            text = '...' + text[3:]
+        key = (path, max_width)
+        text = self._path_cache.get(key)
+        if text is None:
+            font = self.font
+            text = path
+            if font.size(path)[0] > max_width:
+                # Keep the longest tail that fits after the ellipsis, measured
+                # from one pass over the glyph advances
+                budget = max_width - font.size('...')[0]
+                advances = [metrics[4] if metrics else 0 for metrics in font.metrics(path)]
+                cut = len(path)
+                width = 0
+                while cut > 0 and width + advances[cut - 1] <= budget:
+                    cut -= 1
+                    width += advances[cut]
+                text = '...' + path[cut:]
+                # Advances can be off by a pixel from the rendered size
+                while font.size(text)[0] > max_width and cut < len(path):
+                    cut += 1
+                    text = '...' + path[cut:]
+            self._path_cache[key] = text
         return text
 
     def draw_close_button(self, screen, mouse_pos):
         """Draw the close button for the settings menu."""
-        close_size = (min(int(self.width * 0.15), 90), min(int(self.height * 0.08), 36))
-        close_rect = pygame.Rect(self.pos[0] + self.width - close_size[0] - self.padding,
-                               self.pos[1] + self.height - close_size[1] - self.padding, *close_size)
+        close_rect = self._close_rect
         color = tuple(min(c + 20, 255) for c in self.colors['toggle']['on']) if close_rect.collidepoint(mouse_pos) else self.colors['toggle']['on']
-        pygame.draw.rect(screen, color, close_rect, 0, 6)
-        pygame.draw.rect(screen, self.colors['toggle']['border'], close_rect, 2, 6)
-        close_text = self.font.render("Close", True, self.colors['text_light'])
-        text_rect = close_text.get_rect(center=close_rect.center)
-        screen.blit(close_text, text_rect)
-
-    def draw_popup(self, screen):
-        """Render a popup with a message and optional progress bar."""
-        # Define popup dimensions
-        popup_width = int(self.width * 0.5)
-        popup_height = int(self.height * 0.3)
-        popup_x = self.pos[0] + (self.width - popup_width) // 2
-        popup_y = self.pos[1] + (self.height - popup_height) // 2
-        popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(screen, self.colors['popup_bg'], popup_rect, border_radius=10)
-        pygame.draw.rect(screen, self.colors['border'], popup_rect, 2, border_radius=10)
-
-        # Render the message
-        message = self.popup['message']
-        message_lines = message.split('\n')
-        for i, line in enumerate(message_lines):
-            text = self.popup_font.render(line, True, self.colors['popup_text'])
-            text_rect = text.get_rect(center=(popup_x + popup_width // 2, popup_y + 50 + i * 30))
-            screen.blit(text, text_rect)
+        self.draw_rounded_rect(screen, close_rect, color, self.colors['toggle']['border'])
+        self.blit_text_centered(screen, "Close", self.colors['text_light'], close_rect.center)
+
+    def draw_popup(self, screen, popup):
+        """
+        Render a popup with a message and optional progress bar.
+
+        :param screen: The Pygame screen surface.
+        :param popup: The popup state set by show_popup.
+        """
+        # Background and message are pre-rendered on the first frame
+        layout = popup.get('layout')
+        if layout is None:
+            layout = popup['layout'] = self.layout_popup(popup)
+        surface, surface_pos, progress_rect = layout
+        screen.blit(surface, surface_pos)
 
         # Render progress bar if needed
-        if self.popup['type'] == 'saving':
-            progress_bar_width = popup_width - 40
-            progress_bar_height = 20
-            progress_x = popup_x + 20
-            progress_y = popup_y + 150
-            pygame.draw.rect(screen, self.colors['progress_bar_bg'], (progress_x, progress_y, progress_bar_width, progress_bar_height), border_radius=10)
+        if progress_rect is not None:
+            progress_x, progress_y, progress_bar_width, progress_bar_height = progress_rect
+            self.draw_rounded_rect(screen, progress_rect, self.colors['progress_bar_bg'], radius=10)
             # Indeterminate progress bar (animation)
             current_time = pygame.time.get_ticks() // 10
             moving_width = 100
             move_x = (current_time % (progress_bar_width + moving_width)) - moving_width
-            pygame.draw.rect(screen, self.colors['progress_bar_fill'], (progress_x + move_x, progress_y, moving_width, progress_bar_height), border_radius=10)
+            self.draw_rounded_rect(screen, (progress_x + move_x, progress_y, moving_width, progress_bar_height), self.colors['progress_bar_fill'], radius=10)
+
+    def layout_popup(self, popup):
+        """
+        Pre-render a popup's background and message.
+
+        :param popup: The popup state set by show_popup.
+        :return: Tuple of the surface, its screen position and the progress
+            bar rect (None unless the popup is of type 'saving').
+        """
+        # Define popup dimensions
+        popup_width = int(self.width * 0.5)
+        # Lines are wrapped to the box, since antialiased text over the
+        # color key would pick up fringes outside it
+        lines = []
+        for line in popup['message'].split('\n'):
+            lines += self.wrap_text(line, self.popup_font, popup_width - 40)
+        content_height = 50 + len(lines) * 30
+        progress_top = max(150, content_height)
+        if popup['type'] == 'saving':
+            content_height = progress_top + 40
+        popup_height = max(int(self.height * 0.3), content_height)
+        popup_x = self.pos[0] + (self.width - popup_width) // 2
+        popup_y = self.pos[1] + (self.height - popup_height) // 2
+
+        surface = self.keyed_surface(popup_width, popup_height)
+        self.draw_rounded_rect(surface, (0, 0, popup_width, popup_height),
+                               self.colors['popup_bg'], self.colors['border'], radius=10)
+        for i, line in enumerate(lines):
+            text = self.popup_font.render(line, True, self.colors['popup_text'])
+            surface.blit(text, text.get_rect(center=(popup_width // 2, 50 + i * 30)))
+
+        progress_rect = None
+        if popup['type'] == 'saving':
+            progress_rect = (popup_x + 20, popup_y + progress_top, popup_width - 40, 20)
+        return surface, (popup_x, popup_y), progress_rect
+
+    def wrap_text(self, text, font, max_width):
+        """
+        Break a line of text into lines that fit a width.
+        Breaks at spaces where possible; words that are too long on their own,
+        such as paths, are broken between characters.
+
+        :param text: The line to wrap.
+        :param font: Font the text is rendered with.
+        :param max_width: Maximum width of a line in pixels.
+        :return: List of lines.
+        """
+        lines = []
+        current = ''
+        for word in text.split(' '):
+            candidate = f"{current} {word}" if current else word
+            if font.size(candidate)[0] <= max_width:
+                current = candidate
+                continue
+            if current:
+                lines.append(current)
+            current = ''
+            while font.size(word)[0] > max_width:
+                # Longest prefix that fits, at least one character
+                cut = len(word) - 1
+                while cut > 1 and font.size(word[:cut])[0] > max_width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            current = word
+        lines.append(current)
+        return lines
 
     def handle_event(self, event):
         """
@@ -423,9 +726,7 @@ class SettingsMenu:
             return self.handle_mouse_down(event.pos)
         elif event.type == pygame.MOUSEBUTTONUP:
             was_dragging = self.dragging is not None
-            if self.dragging:
-                self.dragging["active"] = False
-                self.dragging = None
+            self.release_dragging()
             return was_dragging
         elif event.type == pygame.MOUSEMOTION and self.dragging:
             self.update_slider_value(event.pos[0], self.dragging)
@@ -435,93 +736,71 @@ class SettingsMenu:
 
     def handle_mouse_down(self, mouse_pos):
         """Handle mouse button down events."""
-        tab_width = self.width // len(self.tabs)
-        for i in range(len(self.tabs)):
-            tab_rect = pygame.Rect(self.pos[0] + (i * tab_width), self.pos[1], tab_width, self.tab_height)
-            if tab_rect.collidepoint(mouse_pos):
-                self.active_tab = i
-                return True
+        if not self._menu_rect.collidepoint(mouse_pos):
+            return False
+        for rect, press in self.tabs[self.active_tab]["hit_targets"]:
+            if rect.collidepoint(mouse_pos):
+                return press(mouse_pos)
+        return False
 
-        close_size = (min(int(self.width * 0.15), 90), min(int(self.height * 0.08), 36))
-        close_rect = pygame.Rect(self.pos[0] + self.width - close_size[0] - self.padding,
-                               self.pos[1] + self.height - close_size[1] - self.padding, *close_size)
-        if close_rect.collidepoint(mouse_pos):
-            self.visible = False
-            return True
+    def press_tab(self, index, mouse_pos):
+        """Switch to the clicked tab."""
+        self.active_tab = index
+        return True
 
-        active_tab = self.tabs[self.active_tab]
-        for control in active_tab["controls"]:
-            if control["type"] == "slider":
-                handle_rect = control["handle_rect"].copy()
-                handle_rect.x += self.pos[0]
-                handle_rect.y += self.pos[1]
-                slider_rect = control["rect"].copy()
-                slider_rect.x += self.pos[0]
-                slider_rect.y += self.pos[1]
-
-                if handle_rect.collidepoint(mouse_pos) or slider_rect.collidepoint(mouse_pos):
-                    control["active"] = True
-                    self.dragging = control
-                    self.update_slider_value(mouse_pos[0], control)
-                    self.update_control_positions()
-                    return True
-            elif control["type"] == "toggle":
-                control_rect = control["rect"].copy()
-                control_rect.x += self.pos[0]
-                control_rect.y += self.pos[1]
-                if control_rect.collidepoint(mouse_pos):
-                    self.toggle_value(control)
-                    return True
-            elif control["type"] == "folder_selector":
-                folder_rect = control["rect"].copy()
-                folder_rect.x += self.pos[0]
-                folder_rect.y += self.pos[1]
-                button_rect = control["button_rect"].copy()
-                button_rect.x += self.pos[0] + folder_rect.width + 10  # Adjusted positioning
-                button_rect.y += self.pos[1]
-                if button_rect.collidepoint(mouse_pos):
-                    self.select_video_output_folder(control)
-                    return True
+    def press_close(self, mouse_pos):
+        """Hide the menu when the close button is clicked."""
+        self.visible = False
+        return True
 
-        return False
+    def press_slider(self, control, mouse_pos):
+        """Start dragging the clicked slider."""
+        control["active"] = True
+        self.dragging = control
+        self.update_slider_value(mouse_pos[0], control)
+        return True
+
+    def press_toggle(self, control, mouse_pos):
+        """Flip the clicked toggle."""
+        self.toggle_value(control)
+        return True
+
+    def press_browse(self, mouse_pos):
+        """Open the folder dialog when the Browse button is clicked."""
+        self.select_video_output_folder()
+        return True
 
     def update_slider_value(self, mouse_x, control):
         """Update the value of a slider based on mouse position."""
-        slider_rect = control["rect"].copy()
-        slider_rect.x += self.pos[0]
+        slider_rect = control["abs_rect"]
         relative_x = max(0, min(1, (mouse_x - slider_rect.x) / slider_rect.width))
-        value_range = control["max"] - control["min"]
-        value = control["min"] + (value_range * relative_x)
+        step_index = int(relative_x * control["steps"] + 0.5)
         if control["decimal_places"] > 0:
-            value = round(value, control["decimal_places"])
+            value = (control["step_base"] + step_index) / control["scale"]
         else:
-            value = int(round(value))
+            value = control["step_base"] + step_index
         value = min(max(value, control["min"]), control["max"])
         control["value"] = value
-        value_text = f"{value:.{control['decimal_places']}f}" if control["decimal_places"] > 0 else str(int(value))
-        control["text"] = f"{control['label']}: {value_text}"
-        setting_map = {
-            "Learning Rate": ('learning_rate', float),
-            "Hidden Size": ('hidden_size', int),
-            "Mutation Rate": ('mutation_rate', float),
-            "Gravity": ('gravity', float),
-            "Max Torque": ('max_torque', float),
-            "Max Motor Velocity": ('max_motor_velocity', float),
-            "Batch Size": ('batch_size', int),
-            "Iteration Time": ('iteration_time', int)
-        }
-        if control["label"] in setting_map:
-            key, type_ = setting_map[control["label"]]
-            self.settings.set(key, type_(value))
+        self.update_handle(control)
+        control["text"] = control["label_prefix"] + control["value_format"].format(value)
+        # Written once the drag ends, see release_dragging
+        self._pending_settings[control["setting_key"]] = control["setting_type"](value)
+
+    def release_dragging(self):
+        """Release the dragged slider, if any, and write its setting."""
+        if self.dragging:
+            self.dragging["active"] = False
+            self.dragging = None
+        if self._pending_settings:
+            self.settings.update(self._pending_settings)
+            self._pending_settings.clear()
 
     def toggle_value(self, control):
         """Toggle the value of a toggle control."""
         control["value"] = not control["value"]
         control["text"] = "On" if control["value"] else "Off"
-        if control["label"] == "Enable Transparency":
-            self.settings.set('enable_transparency', control["value"])
-        elif control["label"] == "Enable Recording":
-            self.settings.set('enable_recording', control["value"])
+        self.settings.set(control["setting_key"], control["value"])
+        if control["setting_key"] == 'enable_recording':
             if control["value"]:
                 # Enable Recording: start recording
                 if not self.check_ffmpeg_installed():
@@ -546,11 +825,7 @@ class SettingsMenu:
 
     def check_ffmpeg_installed(self):
         """Check if FFmpeg is installed and accessible."""
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return ffmpeg_installed()
 
     def show_popup(self, message, popup_type='info'):
         """
@@ -601,63 +876,94 @@ class SettingsMenu:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        if self.recorder:
+            # Frames of a different size can't go into the same video
+            self.recorder.notify_resize((screen_width, screen_height))
+        # Controls are rebuilt from the settings, so write any drag first
+        self.release_dragging()
         self.init_dimensions()
         self.init_fonts()
         self.create_controls()
         self.update_control_positions()
+        self._panels = {}
+        self._rrect_cache = {}
+        self._hover_state = None
+        if self.popup:
+            # Lay the popup out again for the new size
+            self.popup.pop('layout', None)
 
     def get_screen_size(self):
         """Get the current screen size."""
         return self.screen.get_size()
 
-    def draw_popup(self, screen):
-        """Render a popup with a message and optional progress bar."""
-        # Define popup dimensions
-        popup_width = int(self.width * 0.5)
-        popup_height = int(self.height * 0.3)
-        popup_x = self.pos[0] + (self.width - popup_width) // 2
-        popup_y = self.pos[1] + (self.height - popup_height) // 2
-        popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(screen, self.colors['popup_bg'], popup_rect, border_radius=10)
-        pygame.draw.rect(screen, self.colors['border'], popup_rect, 2, border_radius=10)
-
-        # Render the message
-        message = self.popup['message']
-        message_lines = message.split('\n')
-        for i, line in enumerate(message_lines):
-            text = self.popup_font.render(line, True, self.colors['popup_text'])
-            text_rect = text.get_rect(center=(popup_x + popup_width // 2, popup_y + 50 + i * 30))
-            screen.blit(text, text_rect)
+    def select_video_output_folder(self):
+        """Open a folder dialog on the dialog thread so the game keeps drawing."""
+        if self._folder_dialog_open:
+            return
+        self._folder_dialog_open = True
+        if self._folder_thread is None or not self._folder_thread.is_alive():
+            self._folder_thread = threading.Thread(target=self.run_folder_dialogs, daemon=True)
+            self._folder_thread.start()
+        self._folder_requests.put(self.settings.get('video_output_folder'))
+
+    def run_folder_dialogs(self):
+        """Serve folder dialog requests; runs on the dialog thread for the life of the menu."""
+        # Tk objects must stay on the thread that created them, so the root
+        # is created here on first use and reused by every later dialog
+        root = None
+        while True:
+            initial_dir = self._folder_requests.get()
+            selected_folder = None
+            try:
+                if root is None:
+                    root = tk.Tk()
+                    root.withdraw()  # Hide the main window
+                selected_folder = filedialog.askdirectory(parent=root, initialdir=initial_dir,
+                                                         title="Select Video Output Folder")
+            except Exception as e:
+                print(f"Error opening folder dialog: {e}")
+                # Start from a fresh root next time
+                if root is not None:
+                    try:
+                        root.destroy()
+                    except Exception:
+                        pass
+                root = None
+            finally:
+                # Always answer, so update() clears _folder_dialog_open and Browse works again
+                self._folder_results.put(selected_folder or None)
+
+    def apply_folder_results(self):
+        """Apply folders picked on the dialog thread; called from update()."""
+        while True:
+            try:
+                selected_folder = self._folder_results.get_nowait()
+            except queue.Empty:
+                return
+            self._folder_dialog_open = False
+            if selected_folder:
+                self.set_video_output_folder(selected_folder)
+
+    def set_video_output_folder(self, selected_folder):
+        """
+        Use a newly selected video output folder.
 
-        # Render progress bar if needed
-        if self.popup['type'] == 'saving':
-            progress_bar_width = popup_width - 40
-            progress_bar_height = 20
-            progress_x = popup_x + 20
-            progress_y = popup_y + 150
-            pygame.draw.rect(screen, self.colors['progress_bar_bg'], (progress_x, progress_y, progress_bar_width, progress_bar_height), border_radius=10)
-            # Indeterminate progress bar (animation)
-            current_time = pygame.time.get_ticks() // 10
-            moving_width = 100
-            move_x = (current_time % (progress_bar_width + moving_width)) - moving_width
-            pygame.draw.rect(screen, self.colors['progress_bar_fill'], (progress_x + move_x, progress_y, moving_width, progress_bar_height), border_radius=10)
-
-    def select_video_output_folder(self, control):
-        """Open a folder dialog to select the video output folder."""
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        selected_folder = filedialog.askdirectory(initialdir=self.settings.get('video_output_folder'),
-                                                 title="Select Video Output Folder")
-        root.destroy()
-
-        if selected_folder:
-            # Update the control's current folder display
-            control["current_folder"] = selected_folder
-            self.settings.set('video_output_folder', selected_folder)
-            self.show_popup(f"Video output folder set to:\n{selected_folder}", popup_type='info')
-            # If recording is active, update the recorder's output folder
-            if self.recorder and self.recorder.recording:
-                self.recorder.video_output_folder = selected_folder
+        :param selected_folder: The selected folder path.
+        """
+        # Update the folder selector's display; controls may have been
+        # recreated by a resize while the dialog was open
+        for tab_index, tab in enumerate(self.tabs):
+            for control in tab["controls"]:
+                if control["type"] == "folder_selector":
+                    control["current_folder"] = selected_folder
+                    # The path is baked into that tab's panels
+                    for key in [key for key in self._panels if key[0] == tab_index]:
+                        del self._panels[key]
+        self.settings.set('video_output_folder', selected_folder)
+        self.show_popup(f"Video output folder set to:\n{selected_folder}", popup_type='info')
+        # If recording is active, update the recorder's output folder
+        if self.recorder and self.recorder.recording:
+            self.recorder.video_output_folder = selected_folder
 
 # Public Classes
 __all__ = ['SettingsMenu']
@@ -2,9 +2,10 @@
 
 import os
 import threading
+import time
+import numpy as np
 import pygame
 import subprocess
-import shutil
 import logging
 from datetime import datetime
 from typing import Callable, Optional
@@ -17,10 +18,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hardware H.264 encoders that take the stream without extra device setup, in order of preference
+HARDWARE_ENCODERS = ('h264_nvenc', 'h264_videotoolbox')
+SOFTWARE_ENCODER_ARGS = ('-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'zerolatency', '-crf', '23')
+
+
+# Result of the background encoder probe, None until it finishes
+_probed_encoder_args: Optional[tuple] = None
+_probe_thread: Optional[threading.Thread] = None
+_probe_lock = threading.Lock()
+
+
+def _probe_video_encoder() -> tuple:
+    """
+    Picks the FFmpeg encoder arguments; runs on the probe thread.
+    A hardware encoder is used when it is built in and can encode a test frame
+    (builds list NVENC even without an NVIDIA GPU); libx264 is the fallback.
+
+    :return: Tuple of FFmpeg arguments selecting the encoder.
+    """
+    try:
+        listing = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], stdin=subprocess.DEVNULL,
+                                 capture_output=True, text=True, timeout=10).stdout
+        for encoder in HARDWARE_ENCODERS:
+            if f' {encoder} ' not in listing:
+                continue
+            test = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-f', 'lavfi', '-i', 'color=size=256x256', '-frames:v', '1',
+                 '-pix_fmt', 'yuv420p', '-c:v', encoder, '-f', 'null', '-'],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10
+            )
+            if test.returncode == 0:
+                logger.info(f"Using hardware video encoder: {encoder}")
+                return ('-c:v', encoder)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not probe FFmpeg encoders: {e}")
+    return SOFTWARE_ENCODER_ARGS
+
+
+def probe_video_encoder() -> None:
+    """
+    Starts the one-time encoder probe on a background thread, if it hasn't been started.
+    """
+    global _probe_thread
+
+    def run():
+        global _probed_encoder_args
+        _probed_encoder_args = _probe_video_encoder()
+
+    with _probe_lock:
+        if _probe_thread is None:
+            _probe_thread = threading.Thread(target=run, daemon=True)
+            _probe_thread.start()
+
+
+def video_encoder_args() -> tuple:
+    """
+    Returns the encoder the probe picked without waiting for it.
+    Until the probe has finished, recordings use libx264.
+
+    :return: Tuple of FFmpeg arguments selecting the encoder.
+    """
+    probe_video_encoder()
+    return _probed_encoder_args or SOFTWARE_ENCODER_ARGS
+
 
 class ScreenRecorder:
     """
-    A class to record Pygame screen screenshots at regular intervals and convert them into a video using FFmpeg.
+    A class to record Pygame screen screenshots at regular intervals and stream them into a video using FFmpeg.
 
     Public Methods:
     - start_recording()
@@ -32,7 +97,7 @@ class ScreenRecorder:
         Initializes the ScreenRecorder.
 
         :param screen: The Pygame screen surface to capture.
-        :param get_size_callback: A callback function to get the current screen size.
+        :param get_size_callback: A callback function to get the current screen size when recording starts.
         :param video_output_folder: The directory where the video will be saved.
         :param screenshot_interval: Time interval between screenshots in seconds.
         """
@@ -45,14 +110,23 @@ class ScreenRecorder:
         self.recording_thread: Optional[threading.Thread] = None
         self.conversion_thread: Optional[threading.Thread] = None
 
-        self.screenshot_folder = self._create_screenshot_folder()
+        self.ffmpeg: Optional[subprocess.Popen] = None
+        self.video_filename: Optional[str] = None
         self.frame_count = 0
         self.start_time = None
         self.screen_size = self.get_size()
+        # Set from the main thread by notify_resize()
+        self._resized = False
+        # Set when the recording ended on its own (a resize or FFmpeg going
+        # away); the outcome is kept for the stop_recording() that follows
+        self._self_stopped = False
+        self._stop_error: Optional[str] = None
 
         self.lock = threading.Lock()
         self.stop_event = threading.Event()
 
+        # Usually already started by the settings menu; never blocks
+        probe_video_encoder()
         logger.info(f"Initialized ScreenRecorder with video output folder: {self.video_output_folder}")
 
     def start_recording(self) -> None:
@@ -63,21 +137,35 @@ class ScreenRecorder:
             if self.recording:
                 logger.warning("Recording is already in progress.")
                 return
+            self.start_time = datetime.now()
+            self.frame_count = 0
+            self.screen_size = self.get_size()
+            self._resized = False
+            self._self_stopped = False
+            if not self._start_encoder():
+                return
             self.recording = True
             self.stop_event.clear()
-            self.start_time = datetime.now()
             self.recording_thread = threading.Thread(target=self._record, daemon=True)
             self.recording_thread.start()
             logger.info(f"Recording started at: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     def stop_recording(self, on_complete: Optional[Callable[[str], None]] = None, on_error: Optional[Callable[[str], None]] = None) -> None:
         """
-        Stops the recording process and converts the screenshots into a video.
+        Stops the recording process and finishes encoding the video.
+        If the recording already ended on its own, only reports how its video turned out.
 
         :param on_complete: Callback function called when conversion is complete.
         :param on_error: Callback function called when an error occurs.
         """
         with self.lock:
+            if self._self_stopped:
+                # Already ended, e.g. by a resize; report how its video turned out
+                self._self_stopped = False
+                self.recording = False
+                self.conversion_thread = threading.Thread(target=self._report_result, args=(on_complete, on_error), daemon=True)
+                self.conversion_thread.start()
+                return
             if not self.recording:
                 logger.warning("No recording is in progress to stop.")
                 return
@@ -89,7 +177,7 @@ class ScreenRecorder:
                 if self.recording_thread.is_alive():
                     logger.warning("Recording thread did not finish within the timeout period. Forcing termination.")
             logger.info("Recording stopped.")
-            self.conversion_thread = threading.Thread(target=self._convert_to_video, args=(on_complete, on_error), daemon=True)
+            self.conversion_thread = threading.Thread(target=self._finish_video, args=(on_complete, on_error), daemon=True)
             self.conversion_thread.start()
 
     def _record(self) -> None:
@@ -97,118 +185,158 @@ class ScreenRecorder:
         Records screenshots at regular intervals in a separate thread.
         """
         logger.debug("Recording thread started.")
+        # Screenshots are due at fixed multiples of the interval, so the time
+        # a capture takes doesn't stretch the gaps between frames
+        start = time.monotonic()
+        frame_index = 0
         while not self.stop_event.is_set():
-            current_size = self.get_size()
-            if current_size != self.screen_size:
-                logger.warning(f"Screen size changed from {self.screen_size} to {current_size}. Stopping recording.")
+            if self._resized:
+                logger.warning(f"Screen size changed from {self.screen_size}. Stopping recording.")
+                self._self_stopped = True
+                self.recording = False
+                break
+            if not self._take_screenshot():
+                self._self_stopped = True
                 self.recording = False
                 break
-            self._take_screenshot()
-            self.stop_event.wait(self.screenshot_interval)
+            now = time.monotonic()
+            # Skip any slots a slow capture missed rather than bursting to catch up
+            frame_index = max(frame_index + 1, int((now - start) / self.screenshot_interval) + 1)
+            self.stop_event.wait(start + frame_index * self.screenshot_interval - now)
+        if self._self_stopped:
+            # Stopped on its own; stop_recording() reports the outcome later
+            self._finish_video()
         logger.debug("Recording thread exiting.")
 
-    def _take_screenshot(self) -> None:
+    def notify_resize(self, new_size: tuple) -> None:
         """
-        Takes a screenshot and saves it to the screenshot folder.
-        Discards screenshots that are entirely white.
-        """
-        filename = os.path.join(self.screenshot_folder, f"screenshot_{self.frame_count:05d}.png")
-        try:
-            temp_surface = self.screen.copy()
-            avg_color = pygame.transform.average_color(temp_surface)
-            if avg_color[:3] == (255, 255, 255):  # Ignore alpha if present
-                logger.debug(f"Discarding white screenshot number: {self.frame_count}")
-                return
-            pygame.image.save(temp_surface, filename)
-            self.frame_count += 1
-            logger.info(f"Screenshot saved: {filename}")
-        except Exception as e:
-            logger.error(f"Failed to save screenshot {filename}: {e}")
+        Tells the recorder that the window was resized, which ends the current recording.
 
-    def _convert_to_video(self, on_complete: Optional[Callable[[str], None]] = None, on_error: Optional[Callable[[str], None]] = None) -> None:
+        :param new_size: The new screen size.
         """
-        Uses FFmpeg to convert the screenshots into a video.
+        if tuple(new_size) != self.screen_size:
+            self._resized = True
 
-        :param on_complete: Callback function called when conversion is complete.
-        :param on_error: Callback function called when an error occurs.
+    def _start_encoder(self) -> bool:
         """
-        if not self.frame_count:
-            error_msg = "No screenshots were captured. Video conversion aborted."
-            logger.error(error_msg)
-            if on_error:
-                on_error(error_msg)
-            return
-
-        timestamp = self.start_time.strftime('%Y%m%d_%H%M%S') if self.start_time else 'unknown_time'
-        video_filename = os.path.join(self.video_output_folder, f"recording_{timestamp}.mp4")
-        input_pattern = os.path.join(self.screenshot_folder, 'screenshot_%05d.png')
+        Starts the FFmpeg process that encodes raw RGB frames from its stdin.
 
+        :return: True if FFmpeg was started, False otherwise.
+        """
+        timestamp = self.start_time.strftime('%Y%m%d_%H%M%S')
+        self.video_filename = os.path.join(self.video_output_folder, f"recording_{timestamp}.mp4")
+        width, height = self.screen_size
         command = [
             'ffmpeg',
             '-y',  # Overwrite output files without asking
+            '-f', 'rawvideo',
+            '-pix_fmt', 'rgb24',
+            '-s', f'{width}x{height}',
             '-framerate', '30',
-            '-i', input_pattern,
-            '-c:v', 'libx264',
+            '-i', '-',
+            *video_encoder_args(),
             '-pix_fmt', 'yuv420p',
-            video_filename
+            self.video_filename
         ]
-
-        logger.info(f"Converting screenshots to video: {video_filename}")
         logger.debug(f"FFmpeg command: {' '.join(command)}")
-
         try:
+            os.makedirs(self.video_output_folder, exist_ok=True)
             # Suppress FFmpeg output by redirecting to DEVNULL
-            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            logger.info(f"Video conversion successful. Video saved at: {video_filename}")
-            if on_complete:
-                on_complete(video_filename)
-            self._cleanup_screenshots()
-        except subprocess.CalledProcessError as e:
-            error_msg = f"FFmpeg failed with error code {e.returncode}."
-            logger.error(error_msg)
-            if on_error:
-                on_error(error_msg)
+            self.ffmpeg = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except FileNotFoundError:
-            error_msg = "FFmpeg is not installed or not found in the system's PATH."
-            logger.error(error_msg)
-            if on_error:
-                on_error(error_msg)
+            logger.error("FFmpeg is not installed or not found in the system's PATH.")
+            return False
         except Exception as e:
-            error_msg = f"An unexpected error occurred during video conversion: {e}"
-            logger.error(error_msg)
-            if on_error:
-                on_error(error_msg)
+            logger.error(f"Failed to start FFmpeg: {e}")
+            return False
+        logger.info(f"Streaming recording to: {self.video_filename}")
+        return True
 
-    def _create_screenshot_folder(self) -> str:
+    def _take_screenshot(self) -> bool:
         """
-        Creates the temporary screenshots folder.
+        Takes a screenshot and writes it to the FFmpeg stream as a raw RGB frame.
+        Discards screenshots that are entirely white.
 
-        :return: Path to the temporary screenshots folder.
+        :return: False if FFmpeg no longer accepts frames, True otherwise.
         """
-        temporary_dir = os.path.join(os.path.dirname(__file__), 'temporary')
         try:
-            os.makedirs(temporary_dir, exist_ok=True)
-            logger.info(f"Temporary screenshots will be saved to: {temporary_dir}")
-            return temporary_dir
+            # A single conversion straight off the screen; the surface is only locked inside the call
+            raw = pygame.image.tobytes(self.screen, 'RGB')
+            width, height = self.screen_size
+            if self._is_white(np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 3)):
+                logger.debug(f"Discarding white screenshot number: {self.frame_count}")
+                return True
+            self.ffmpeg.stdin.write(raw)
+            self.frame_count += 1
+            logger.debug(f"Frame written: {self.frame_count}")
+        except (BrokenPipeError, OSError) as e:
+            logger.error(f"FFmpeg stopped accepting frames: {e}")
+            return False
         except Exception as e:
-            logger.error(f"Failed to create temporary screenshot folder at {temporary_dir}: {e}")
-            raise
+            logger.error(f"Failed to capture frame {self.frame_count}: {e}")
+        return True
 
-    def _cleanup_screenshots(self) -> None:
+    @staticmethod
+    def _is_white(pixels: np.ndarray) -> bool:
         """
-        Deletes the screenshot images after video conversion.
-        Retries deletion up to 3 times in case of failure.
+        Checks whether a frame is entirely white.
+        A sparse grid of pixels is checked first; the full scan only runs when it is all white.
+
+        :param pixels: (height, width, 3) view of the frame.
+        :return: True if every pixel is white, False otherwise.
         """
-        retries = 3
-        for attempt in range(1, retries + 1):
-            try:
-                shutil.rmtree(self.screenshot_folder)
-                logger.info(f"Cleaned up screenshots successfully from {self.screenshot_folder}.")
-                return
-            except Exception as e:
-                logger.warning(f"Attempt {attempt} failed to clean up screenshots: {e}")
-                time.sleep(1)
-        logger.error(f"Failed to clean up screenshots after {retries} attempts.")
+        if not (pixels[::16, ::16] == 255).all():
+            return False
+        return bool((pixels == 255).all())
+
+    def _finish_video(self, on_complete: Optional[Callable[[str], None]] = None, on_error: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Closes the FFmpeg stream and waits for the video to be written.
+
+        :param on_complete: Callback function called when the video is complete.
+        :param on_error: Callback function called when an error occurs.
+        """
+        ffmpeg, self.ffmpeg = self.ffmpeg, None
+        try:
+            ffmpeg.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        returncode = ffmpeg.wait()
+
+        if not self.frame_count:
+            error_msg = "No screenshots were captured. Video conversion aborted."
+        elif returncode != 0:
+            error_msg = f"FFmpeg failed with error code {returncode}."
+        else:
+            error_msg = None
+            logger.info(f"Video conversion successful. Video saved at: {self.video_filename}")
+        if error_msg:
+            logger.error(error_msg)
+        self._stop_error = error_msg
+        self._notify(on_complete, on_error)
+
+    def _report_result(self, on_complete: Optional[Callable[[str], None]] = None, on_error: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Reports the video of a recording that stopped on its own, once it is written.
+
+        :param on_complete: Callback function called with the video file.
+        :param on_error: Callback function called with the error message.
+        """
+        self.recording_thread.join()
+        self._notify(on_complete, on_error)
+
+    def _notify(self, on_complete: Optional[Callable[[str], None]], on_error: Optional[Callable[[str], None]]) -> None:
+        """
+        Calls the callback matching the outcome of the last video.
+
+        :param on_complete: Callback function called with the video file.
+        :param on_error: Callback function called with the error message.
+        """
+        if self._stop_error is None:
+            if on_complete:
+                on_complete(self.video_filename)
+        elif on_error:
+            on_error(self._stop_error)
 
     def is_recording(self) -> bool:
         """
@@ -231,4 +359,4 @@ class ScreenRecorder:
 
 
 # Public Classes
-__all__ = ['ScreenRecorder']
+__all__ = ['ScreenRecorder', 'probe_video_encoder']
@@ -1,8 +1,19 @@
 # src/utils/reset.py
 import os
-import shutil
 from config.settings import Settings
 
+def _remove_contents(directory):
+    """
+    Deletes everything inside a directory in one scandir pass per level.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_contents(entry.path)
+                os.rmdir(entry.path)
+            else:
+                os.unlink(entry.path)
+
 def reset_models(models_directory='models'):
     """
     Deletes all model files in the specified directory.
@@ -10,7 +21,8 @@ def reset_models(models_directory='models'):
     """
     if os.path.exists(models_directory):
         try:
-            shutil.rmtree(models_directory)
+            # The directory itself is kept, it is recreated below anyway
+            _remove_contents(models_directory)
             print(f"All models in '{models_directory}' have been deleted.")
         except Exception as e:
             print(f"Error deleting models: {e}")